@@ -1,12 +1,17 @@
 import streamlit as st
+from io import BytesIO
 from pathlib import Path
-from PIL import Image
+from PIL import Image, features
+
+from engine.timing import TIMING_LOG, RerunTimer
 
 # --- CONFIGURACIÓN INICIAL ---
 st.set_page_config(page_title="Filtros",
                    layout="wide",
                   page_icon="🔷")
 
+timer = RerunTimer()
+
 # Configurar el estado inicial
 if 'button_states' not in st.session_state:
     st.session_state.button_states = [0, 0, 0]  # 0 para imagen A, 1 para imagen B
@@ -26,6 +31,30 @@ image_paths = {
     'button3_b': img_dir / 'RLC2.jpg'
 }
 
+# Ancho (px) al que se reducen los esquemáticos: el doble del ancho de cada
+# columna, para que se vean nítidos en pantallas de alta densidad
+DISPLAY_WIDTH = 640
+
+@st.cache_resource(show_spinner=False)
+def load_schematics(paths, width=DISPLAY_WIDTH):
+    # Decodifica, reduce y recodifica cada imagen una sola vez por proceso.
+    # Los reruns (incluido "Cambiar") se sirven desde memoria, sin leer disco.
+    image_format = "WEBP" if features.check("webp") else "JPEG"
+    images = {}
+    for key, path in paths.items():
+        try:
+            with Image.open(path) as image:
+                image.thumbnail((width, width * 2))
+                buffer = BytesIO()
+                image.save(buffer, format=image_format, quality=85)
+            images[key] = buffer.getvalue()
+        except FileNotFoundError:
+            images[key] = None
+    return images
+
+with timer.stage("load_schematics"):
+    schematics = load_schematics(image_paths)
+
 # Configuración de imágenes locales y sus páginas destino
 opciones = [
     {"nombre": "Opción PARC", "archivo": "RC1.jpg", "pagina": "PasaAltos"},
@@ -54,12 +83,12 @@ for idx, (col, opcion) in enumerate(zip(cols, opciones)):
             image_key = f'button{idx+1}_b'
             image_label = "Imagen B"
         
-        try:
-            # Cargar la imagen
-            image = Image.open(image_paths[image_key])
+        image = schematics[image_key]
+        if image is not None:
             # Mostrar la imagen
-            st.image(image, use_container_width=True)
-        except FileNotFoundError:
+            with timer.stage("st.image"):
+                st.image(image, use_container_width=True)
+        else:
             st.error(f"No se encontró la imagen: {image_paths[image_key]}")
             st.info("Asegúrate de que las imágenes estén en el directorio correcto")
         # Botón de opción al fondo
@@ -71,6 +100,9 @@ for idx, (col, opcion) in enumerate(zip(cols, opciones)):
             ):
                 st.session_state.page_to_go = opcion["pagina"]
 
+if st.button("📊 Barrido de parámetros", key="btn_barrido", help="Compara muchas combinaciones de orden y corte a la vez"):
+    st.session_state.page_to_go = "Barrido"
+
 with st.expander("¿Qué hace este Simulador? ❓"):
     st.markdown("""
     - Podrás simular filtros eléctricos pasivos de primer orden (Pasa-Bajo, Pasa-Alto y Pasa-Banda).
@@ -85,6 +117,8 @@ with st.expander("Créditos"):
     - **Materia dictada por**: Pablo König y Juan Carlos Muñoz
     """)
 
+TIMING_LOG.append(timer.as_record(page="app"))
+
 # Redirección fuera del bucle de botones
 if "page_to_go" in st.session_state:
     st.switch_page(f"pages/{st.session_state.page_to_go}.py")
\ No newline at end of file
@@ -0,0 +1 @@
+# Benchmarks del motor de simulación (se ejecutan sin Streamlit).
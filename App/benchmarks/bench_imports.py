@@ -0,0 +1,103 @@
+"""Tiempo de importación de cada punto de entrada, medido con -X importtime.
+
+Uso (desde la carpeta App):
+
+    python -m benchmarks.bench_imports
+    python -m benchmarks.bench_imports --compare benchmarks/baselines/imports.json
+    python -m benchmarks.bench_imports --save benchmarks/baselines/mi_maquina_imports.json
+
+Cada objetivo se importa en un intérprete nuevo, varias veces, y se reporta
+la mediana del tiempo acumulado. También se verifica que la página de inicio
+no cargue los módulos científicos pesados.
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.bench_pipeline import DEFAULT_THRESHOLD, compare, save
+
+APP_DIR = Path(__file__).resolve().parents[1]
+
+# Lo que importa cada punto de entrada antes de dibujar algo
+TARGETS = {
+    "landing": ["streamlit", "PIL.Image", "engine.timing"],
+    "engine": ["engine.pipeline"],
+    "filter_page": ["streamlit", "engine", "ui"],
+}
+
+# Módulos que la página de inicio no debe importar (plotly no figura porque
+# Streamlit ya lo importa por su cuenta)
+HEAVY_MODULES = ["numpy", "scipy", "matplotlib", "pandas"]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def import_profile(modules):
+    """Ejecuta los imports con -X importtime.
+
+    Devuelve {módulo: (µs acumulados, profundidad)}; profundidad 0 son los
+    módulos importados directamente por el código medido.
+    """
+    code = "; ".join(f"import {m}" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            profile[match.group(4)] = (int(match.group(2)), depth)
+    return profile
+
+
+def top_level_total(profile, modules):
+    # Suma de los acumulados de los módulos pedidos (cada uno incluye sus hijos)
+    return sum(profile[m][0] for m in modules if m in profile) / 1e6
+
+
+def run(repeat=5, out=sys.stdout):
+    results = {}
+    heavy_in_landing = []
+    for name, modules in TARGETS.items():
+        totals = []
+        for _ in range(repeat):
+            profile = import_profile(modules)
+            totals.append(top_level_total(profile, modules))
+        results[f"import {name}"] = statistics.median(totals)
+        print(f"{'import ' + name:<24} {results[f'import {name}'] * 1000:10.1f} ms", file=out)
+
+        if name == "landing":
+            heavy_in_landing = [m for m in HEAVY_MODULES if m in profile]
+
+        # Las dependencias directas más lentas de cada objetivo
+        children = [(m, us) for m, (us, depth) in profile.items() if depth == 1]
+        slowest = sorted(children, key=lambda item: -item[1])[:5]
+        print("    " + ", ".join(f"{m} {us / 1000:.0f} ms" for m, us in slowest), file=out)
+
+    if heavy_in_landing:
+        print(f"La página de inicio importa módulos pesados: {', '.join(heavy_in_landing)}", file=out)
+    return results, heavy_in_landing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="guardar los resultados como línea base (JSON)")
+    parser.add_argument("--compare", help="línea base (JSON) contra la que comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results, heavy_in_landing = run(args.repeat)
+    if args.save:
+        save(results, args.save)
+    regressions = compare(results, args.compare, args.threshold) if args.compare else []
+    return 1 if regressions or heavy_in_landing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Benchmarks del pipeline de filtrado, sin Streamlit.
+
+Uso (desde la carpeta App):
+
+    python -m benchmarks.bench_pipeline --quick --compare benchmarks/baselines/pipeline.json
+    python -m benchmarks.bench_pipeline --save benchmarks/baselines/mi_maquina.json
+    python -m benchmarks.bench_pipeline --compare benchmarks/baselines/mi_maquina.json
+
+Cada caso mide el mejor tiempo de varias repeticiones. Con --compare se
+marcan los casos que empeoraron más que --threshold respecto de la línea
+base y el proceso termina con código 1 si hay alguno.
+
+benchmarks/baselines/pipeline.json es la línea base de referencia (grilla
+completa, así que también cubre --quick). Los tiempos dependen de la
+máquina: para detectar regresiones conviene guardar una propia antes del
+cambio y comparar en la misma máquina.
+"""
+import argparse
+import itertools
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+from scipy import signal
+
+from engine import (
+    apply_design,
+    band_limited_noise,
+    bode_frequencies,
+    compute_spectrum,
+    design_filter,
+    frequency_response,
+    get_fir_design,
+    sos_bode,
+    sos_frequency_response,
+)
+
+SAMPLE_RATES = [1000, 8000, 44100, 192000]
+DURATIONS = [1.0, 10.0]
+ORDERS = [1, 2, 4, 6, 8, 10]
+FILTER_TYPES = {
+    "Pasa-Bajo": 20.0,
+    "Pasa-Alto": 20.0,
+    "Pasa-Banda": (15.0, 35.0),
+}
+
+QUICK_SAMPLE_RATES = [1000, 44100]
+QUICK_DURATIONS = [1.0]
+QUICK_ORDERS = [2, 10]
+
+DEFAULT_THRESHOLD = 0.25
+
+
+def _signal(fs, duration):
+    rng = np.random.default_rng(0)
+    return rng.standard_normal(int(round(fs * duration)))
+
+
+# Cada benchmark recibe el caso y devuelve la función a cronometrar
+def bench_band_limited_noise(case, x):
+    fs = case["fs"]
+    return lambda: band_limited_noise(45, 55, len(x), fs, np.random.default_rng(0))
+
+
+def bench_filtfilt_ba(case, x):
+    b, a = design_filter(case["filter_type"], case["order"], case["cutoff"], case["fs"])
+    return lambda: signal.filtfilt(b, a, x)
+
+
+def bench_sosfiltfilt(case, x):
+    sos = design_filter(case["filter_type"], case["order"], case["cutoff"], case["fs"], output="sos")
+    return lambda: signal.sosfiltfilt(sos, x)
+
+
+def bench_spectrum(case, x):
+    fs = case["fs"]
+    return lambda: compute_spectrum(x, x, fs)
+
+
+def bench_freqz_ba(case, x):
+    b, a = design_filter(case["filter_type"], case["order"], case["cutoff"], case["fs"])
+    return lambda: frequency_response(b, a, case["fs"], worN=8000)
+
+
+def bench_sosfreqz(case, x):
+    sos = design_filter(case["filter_type"], case["order"], case["cutoff"], case["fs"], output="sos")
+    return lambda: sos_frequency_response(sos, case["fs"], worN=8000)
+
+
+def bench_bode(case, x):
+    sos = design_filter(case["filter_type"], case["order"], case["cutoff"], case["fs"], output="sos")
+    freqs = bode_frequencies(case["fs"])
+    return lambda: sos_bode(sos, freqs, case["fs"])
+
+
+def bench_fir_oaconvolve(case, x):
+    design = get_fir_design(case["filter_type"], None, case["cutoff"], case["fs"])
+    return lambda: apply_design(design, x)
+
+
+# Benchmarks que dependen del filtro y los que solo dependen de la señal
+FILTER_BENCHMARKS = {
+    "filtfilt_ba": bench_filtfilt_ba,
+    "sosfiltfilt": bench_sosfiltfilt,
+    "freqz_ba": bench_freqz_ba,
+    "sosfreqz": bench_sosfreqz,
+    "bode": bench_bode,
+    "fir_oaconvolve": bench_fir_oaconvolve,
+}
+SIGNAL_BENCHMARKS = {
+    "band_limited_noise": bench_band_limited_noise,
+    "spectrum": bench_spectrum,
+}
+
+
+def iter_cases(quick=False):
+    sample_rates = QUICK_SAMPLE_RATES if quick else SAMPLE_RATES
+    durations = QUICK_DURATIONS if quick else DURATIONS
+    orders = QUICK_ORDERS if quick else ORDERS
+
+    for fs, duration in itertools.product(sample_rates, durations):
+        base = {"fs": fs, "duration": duration}
+        for name, bench in SIGNAL_BENCHMARKS.items():
+            yield name, bench, base
+        for (filter_type, cutoff), order in itertools.product(FILTER_TYPES.items(), orders):
+            case = dict(base, filter_type=filter_type, cutoff=cutoff, order=order)
+            for name, bench in FILTER_BENCHMARKS.items():
+                yield name, bench, case
+
+
+def case_id(name, case):
+    parts = [name, f"fs={case['fs']}", f"dur={case['duration']:g}"]
+    if "filter_type" in case:
+        parts += [case["filter_type"], f"n={case['order']}"]
+    return " ".join(parts)
+
+
+def time_call(func, repeat=5):
+    # Mejor tiempo por llamada: se ajusta la cantidad de llamadas a ~0.2 s
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, number // 2)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(quick=False, repeat=5, pattern=None, out=sys.stdout):
+    results = {}
+    signals = {}
+    for name, bench, case in iter_cases(quick):
+        cid = case_id(name, case)
+        if pattern and pattern not in cid:
+            continue
+        key = (case["fs"], case["duration"])
+        if key not in signals:
+            signals = {key: _signal(*key)}
+        with np.errstate(all='ignore'):
+            seconds = time_call(bench(case, signals[key]), repeat)
+        results[cid] = seconds
+        print(f"{cid:<60} {seconds * 1000:10.3f} ms", file=out)
+    return results
+
+
+def save(results, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+
+
+def compare(results, path, threshold=DEFAULT_THRESHOLD, out=sys.stdout):
+    """Compara contra una línea base y devuelve los casos que empeoraron."""
+    baseline = json.loads(Path(path).read_text())["results"]
+    regressions = []
+    for cid, seconds in results.items():
+        if cid not in baseline:
+            continue
+        ratio = seconds / baseline[cid]
+        if ratio > 1 + threshold:
+            regressions.append((cid, ratio))
+            print(f"REGRESIÓN {cid}: {ratio:.2f}x más lento", file=out)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="grilla reducida de fs, duraciones y órdenes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", dest="pattern", help="solo casos cuyo id contenga este texto")
+    parser.add_argument("--save", help="guardar los resultados como línea base (JSON)")
+    parser.add_argument("--compare", help="línea base (JSON) contra la que comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run(args.quick, args.repeat, args.pattern)
+    if args.save:
+        save(results, args.save)
+    if args.compare and compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""Resumen p50/p95 por etapa del registro de tiempos de las páginas.
+
+Uso (desde la carpeta App):
+
+    python -m benchmarks.timing_report
+    python -m benchmarks.timing_report --page Pasa-Banda --log logs/timings.jsonl
+"""
+import argparse
+import sys
+
+from engine.timing import TimingLog, aggregate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--log", help="archivo de registro (por defecto, el de las páginas)")
+    parser.add_argument("--page", help="solo los reruns de esta página")
+    args = parser.parse_args(argv)
+
+    stats = aggregate(TimingLog(args.log).records(), page=args.page)
+    print(f"{'Etapa':<20} {'Muestras':>9} {'p50 (ms)':>10} {'p95 (ms)':>10}")
+    for name, s in sorted(stats.items(), key=lambda item: -item[1]["p95"]):
+        print(f"{name:<20} {s['count']:>9} {s['p50'] * 1000:>10.2f} {s['p95'] * 1000:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# Motor de simulación de filtros, independiente de Streamlit.
+#
+# Los nombres públicos se importan recién cuando se usan (PEP 562): importar
+# un submódulo liviano como engine.timing no arrastra numpy ni scipy.
+import importlib
+
+_EXPORTS = {
+    "BodeResponse": "bode",
+    "bode_cache_info": "bode",
+    "bode_frequencies": "bode",
+    "clear_bode_cache": "bode",
+    "get_bode_response": "bode",
+    "sos_bode": "bode",
+    "tf_bode": "bode",
+    "CIRCUITS": "circuits",
+    "Circuit": "circuits",
+    "ToleranceResult": "circuits",
+    "analog_coefficients": "circuits",
+    "bilinear_prewarped": "circuits",
+    "circuit_filter": "circuits",
+    "cutoff_frequencies": "circuits",
+    "nominal_components": "circuits",
+    "tolerance_analysis": "circuits",
+    "EXPORT_FORMATS": "export",
+    "export_bytes": "export",
+    "load_run": "export",
+    "result_arrays": "export",
+    "save_npz": "export",
+    "save_parquet": "export",
+    "FILTER_STRUCTURES": "filters",
+    "FilterDesign": "filters",
+    "apply_design": "filters",
+    "apply_fir": "filters",
+    "apply_filter": "filters",
+    "apply_sos_filter": "filters",
+    "clear_design_cache": "filters",
+    "design_cache_info": "filters",
+    "design_filter": "filters",
+    "frequency_response": "filters",
+    "get_filter_design": "filters",
+    "needs_sos": "filters",
+    "sos_frequency_response": "filters",
+    "DESIGN_METHODS": "fir",
+    "FIR_MAX_TAPS": "fir",
+    "compare_fir_iir": "fir",
+    "design_fir": "fir",
+    "fir_block_size": "fir",
+    "fir_filter_in_chunks": "fir",
+    "fir_numtaps": "fir",
+    "get_fir_design": "fir",
+    "PipelineGraph": "graph",
+    "Stage": "graph",
+    "StageRun": "graph",
+    "confidence_interval": "metrics",
+    "power_db": "metrics",
+    "snr_db": "metrics",
+    "Realisation": "montecarlo",
+    "get_executor": "montecarlo",
+    "run_monte_carlo": "montecarlo",
+    "run_realisation": "montecarlo",
+    "summarize": "montecarlo",
+    "analysis_rate": "multirate",
+    "anti_alias_taps": "multirate",
+    "decimate": "multirate",
+    "interpolate": "multirate",
+    "multirate_factor": "multirate",
+    "BankInfo": "noisebank",
+    "NoiseBank": "noisebank",
+    "FILTER_BTYPES": "params",
+    "NOISE_TYPES": "params",
+    "SimulationParams": "params",
+    "WAVEFORM_TYPES": "params",
+    "SIMULATION_STAGES": "pipeline",
+    "SimulationResult": "pipeline",
+    "make_simulation_graph": "pipeline",
+    "make_streaming_graph": "pipeline",
+    "result_from_values": "pipeline",
+    "simulate": "pipeline",
+    "simulate_streaming": "pipeline",
+    "stream_spectrograms": "pipeline",
+    "streams_in_blocks": "pipeline",
+    "DEFAULT_PLOT_BUCKETS": "plotdata",
+    "minmax_decimate": "plotdata",
+    "RealtimeSimulation": "realtime",
+    "RingBuffer": "realtime",
+    "NOISE_BANK": "signals",
+    "band_limited_noise": "signals",
+    "generate_noise": "signals",
+    "generate_waveform": "signals",
+    "time_vector": "signals",
+    "unit_noise": "signals",
+    "IncrementalSpectrogram": "spectral",
+    "SPECTRAL_WINDOWS": "spectral",
+    "SegmentPlan": "spectral",
+    "nperseg_for": "spectral",
+    "segment_count": "spectral",
+    "segment_plan": "spectral",
+    "segment_power": "spectral",
+    "segment_times": "spectral",
+    "spectrogram": "spectral",
+    "welch_psd": "spectral",
+    "DISPLAY_MAX_FREQ": "spectrum",
+    "compute_spectrum": "spectrum",
+    "magnitude_spectrum": "spectrum",
+    "DEFAULT_CHUNK_SIZE": "streaming",
+    "MAX_IN_MEMORY_SAMPLES": "streaming",
+    "check_in_memory": "streaming",
+    "filter_in_chunks": "streaming",
+    "generate_chunks": "streaming",
+    "iter_chunks": "streaming",
+    "sample_count": "streaming",
+    "stream_filter": "streaming",
+    "zero_phase_pass": "streaming",
+    "cutoff_grid": "sweep",
+    "run_sweep": "sweep",
+    "RerunTimer": "timing",
+    "TIMING_LOG": "timing",
+    "TimingLog": "timing",
+    "aggregate": "timing",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from scipy import signal
+
+from .filters import DESIGN_CACHE_SIZE, get_filter_design
+from .fir import get_fir_design
+from .spectrum import DISPLAY_MAX_FREQ
+
+# Banda por defecto del diagrama de Bode: tres décadas hasta el límite de
+# los gráficos, con una grilla logarítmica de BODE_POINTS puntos
+BODE_DECADES = 3
+BODE_POINTS = 512
+
+
+@dataclass(frozen=True)
+class BodeResponse:
+    # Respuesta en frecuencia sobre una grilla logarítmica (solo lectura).
+    # Fase desenrollada en grados y retardo de grupo en segundos.
+    freqs: np.ndarray
+    h: np.ndarray
+    magnitude_db: np.ndarray
+    phase_deg: np.ndarray
+    group_delay: np.ndarray
+
+
+def bode_frequencies(fs, f_min=None, f_max=DISPLAY_MAX_FREQ, points=BODE_POINTS):
+    """Grilla logarítmica entre f_min y f_max, recortada por debajo de Nyquist."""
+    f_max = min(f_max, fs / 2 * (1 - 1e-6))
+    if f_min is None:
+        f_min = f_max / 10**BODE_DECADES
+    if not 0 < f_min < f_max:
+        raise ValueError(f"Banda de Bode inválida: {f_min}-{f_max} Hz")
+    return np.geomspace(f_min, f_max, points)
+
+
+def _evaluate(coeffs, omega):
+    # P(z) y Σ k·p_k·z^-k de cada fila de `coeffs` sobre z = e^{jω}: (F, S)
+    k = np.arange(coeffs.shape[1])
+    powers = np.exp(-1j * omega[:, None] * k)
+    return powers @ coeffs.T, powers @ (coeffs * k).T
+
+
+def _bode(num, den, freqs, fs):
+    omega = 2 * np.pi * np.asarray(freqs) / fs
+    num, num_k = _evaluate(num, omega)
+    den, den_k = _evaluate(den, omega)
+    h = np.prod(num / den, axis=1)
+
+    # τ(ω) = Re{Σ k·b_k z^-k / B(z)} - Re{Σ k·a_k z^-k / A(z)}, en muestras.
+    # Donde B(z) se anula (ceros sobre el círculo unidad) el aporte es 0.
+    singular = np.abs(num) < 1e-12
+    num_delay = np.divide(num_k, num, out=np.zeros_like(num), where=~singular)
+    group_delay = (num_delay - den_k / den).real.sum(axis=1) / fs
+
+    with np.errstate(divide='ignore'):
+        magnitude_db = 20 * np.log10(np.abs(h))
+    phase_deg = np.degrees(np.unwrap(np.angle(h)))
+    return BodeResponse(
+        freqs=np.asarray(freqs), h=h, magnitude_db=magnitude_db,
+        phase_deg=phase_deg, group_delay=group_delay,
+    )
+
+
+def sos_bode(sos, freqs, fs):
+    """Magnitud, fase y retardo de grupo de una cascada SOS en una sola pasada.
+
+    Cada sección se evalúa una vez sobre las frecuencias pedidas; la
+    respuesta es el producto de las secciones (lo mismo que sosfreqz) y el
+    retardo de grupo la suma de los retardos de cada sección.
+    """
+    sos = np.atleast_2d(sos)
+    return _bode(sos[:, :3], sos[:, 3:], freqs, fs)
+
+
+def tf_bode(b, a, freqs, fs):
+    # Igual que sos_bode para un único polinomio (b, a), p. ej. un FIR
+    return _bode(np.atleast_2d(b), np.atleast_2d(a), freqs, fs)
+
+
+@lru_cache(maxsize=DESIGN_CACHE_SIZE)
+def _cached_bode(filter_type, order, cutoff, fs, structure, method, numtaps, f_min, f_max, points):
+    freqs = bode_frequencies(fs, f_min, f_max, points)
+    if method != "iir":
+        design = get_fir_design(filter_type, numtaps, cutoff, fs, method)
+        response = tf_bode(design.b, design.a, freqs, fs)
+    else:
+        design = get_filter_design(filter_type, order, cutoff, fs, structure=structure)
+        # Un diseño (b, a) se evalúa igual como secciones SOS
+        sos = design.sos if design.sos is not None else signal.tf2sos(design.b, design.a)
+        response = sos_bode(sos, freqs, fs)
+    for arr in (response.freqs, response.h, response.magnitude_db, response.phase_deg, response.group_delay):
+        arr.flags.writeable = False
+    return response
+
+
+def get_bode_response(filter_type, order, cutoff, fs, structure="auto", method="iir", numtaps=None,
+                      f_min=None, f_max=DISPLAY_MAX_FREQ, points=BODE_POINTS):
+    """Diagrama de Bode del filtro, memoizado por diseño y banda.
+
+    A diferencia de freqz (grilla lineal hasta Nyquist) solo se evalúa la
+    banda pedida, con puntos espaciados logarítmicamente.
+    """
+    if isinstance(cutoff, list):
+        cutoff = tuple(cutoff)
+    return _cached_bode(filter_type, int(order), cutoff, fs, structure, method, numtaps, f_min, f_max, points)
+
+
+def bode_cache_info():
+    return _cached_bode.cache_info()
+
+
+def clear_bode_cache():
+    _cached_bode.cache_clear()
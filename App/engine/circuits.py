@@ -0,0 +1,199 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+# Modelos de los circuitos de la portada a partir de sus componentes.
+#
+# Cada circuito da su transferencia analógica H(s) = N(s)/D(s) con
+# coeficientes (s², s, 1) calculados sobre arreglos de R, L y C: con arreglos
+# de N sorteos se obtienen N filtros de una sola vez, sin bucles.
+
+
+def _rc_high(R, L, C):
+    # C en serie, salida sobre R: sRC / (sRC + 1)
+    zero = np.zeros_like(R * C)
+    return np.stack([zero, R * C, zero], -1), np.stack([zero, R * C, zero + 1], -1)
+
+
+def _rl_high(R, L, C):
+    # R en serie, salida sobre L: sL / (sL + R)
+    zero = np.zeros_like(R * L)
+    return np.stack([zero, L + zero, zero], -1), np.stack([zero, L + zero, R + zero], -1)
+
+
+def _rc_low(R, L, C):
+    # R en serie, salida sobre C: 1 / (sRC + 1)
+    zero = np.zeros_like(R * C)
+    return np.stack([zero, zero, zero + 1], -1), np.stack([zero, R * C, zero + 1], -1)
+
+
+def _rl_low(R, L, C):
+    # L en serie, salida sobre R: R / (sL + R)
+    zero = np.zeros_like(R * L)
+    return np.stack([zero, zero, R + zero], -1), np.stack([zero, L + zero, R + zero], -1)
+
+
+def _rlc_series(R, L, C):
+    # C y L en serie, salida sobre R: sRC / (s²LC + sRC + 1)
+    zero = np.zeros_like(R * L * C)
+    return np.stack([zero, R * C, zero], -1), np.stack([L * C, R * C, zero + 1], -1)
+
+
+def _rlc_tank(R, L, C):
+    # R en serie, salida sobre L ∥ C: sL / (s²RLC + sL + R)
+    zero = np.zeros_like(R * L * C)
+    return np.stack([zero, L + zero, zero], -1), np.stack([R * L * C, L + zero, R + zero], -1)
+
+
+@dataclass(frozen=True)
+class Circuit:
+    # Esquemático de la portada: imagen, tipo de filtro y componentes que usa
+    name: str
+    label: str
+    filter_type: str
+    components: tuple
+    order: int
+    transfer: object
+
+
+CIRCUITS = {
+    "RC1": Circuit("RC1", "Pasa Alto RC", "Pasa-Alto", ("R", "C"), 1, _rc_high),
+    "RL1": Circuit("RL1", "Pasa Alto RL", "Pasa-Alto", ("R", "L"), 1, _rl_high),
+    "RC2": Circuit("RC2", "Pasa Bajos RC", "Pasa-Bajo", ("R", "C"), 1, _rc_low),
+    "RL2": Circuit("RL2", "Pasa Bajos RL", "Pasa-Bajo", ("R", "L"), 1, _rl_low),
+    "RLC1": Circuit("RLC1", "Pasa Banda RLC serie", "Pasa-Banda", ("R", "L", "C"), 2, _rlc_series),
+    "RLC2": Circuit("RLC2", "Pasa Banda RLC paralelo", "Pasa-Banda", ("R", "L", "C"), 2, _rlc_tank),
+}
+
+# Tolerancias típicas (fracción del valor nominal)
+DEFAULT_TOLERANCES = {"R": 0.05, "L": 0.10, "C": 0.10}
+DEFAULT_DRAWS = 5000
+
+
+def _components(values):
+    # Arreglos R, L, C con broadcasting; los que el circuito no usa valen 1
+    return tuple(np.asarray(values.get(name, 1.0), dtype=float) for name in ("R", "L", "C"))
+
+
+def analog_coefficients(circuit, values):
+    """Numerador y denominador de H(s), forma (..., 3) con orden (s², s, 1)."""
+    return circuit.transfer(*_components(values))
+
+
+def natural_frequency(den):
+    # ω (rad/s) del polo real (1er orden) o de resonancia (2º orden)
+    a2, a1, a0 = np.moveaxis(den, -1, 0)
+    return np.where(a2 == 0, a0 / np.where(a1 == 0, np.inf, a1), np.sqrt(a0 / np.where(a2 == 0, 1, a2)))
+
+
+def cutoff_frequencies(circuit, values):
+    """Frecuencia(s) de corte a -3 dB en Hz, exactas para el modelo analógico.
+
+    Pasa-Bajo/Pasa-Alto devuelven forma (...); Pasa-Banda (..., 2) con los
+    bordes inferior y superior de la banda.
+    """
+    _, den = analog_coefficients(circuit, values)
+    a2, a1, a0 = np.moveaxis(den, -1, 0)
+    if circuit.order == 1:
+        return a0 / a1 / (2 * np.pi)
+    # Pasa banda de ganancia unitaria: ω0² = a0/a2 y ancho de banda a1/a2
+    w0_sq = a0 / a2
+    half_bw = a1 / a2 / 2
+    root = np.sqrt(half_bw**2 + w0_sq)
+    return np.stack([root - half_bw, root + half_bw], -1) / (2 * np.pi)
+
+
+def nominal_components(circuit, cutoff, R=1000.0):
+    """Valores de L y C que, con la R dada, dan el corte (o la banda) pedido."""
+    if circuit.order == 1:
+        wc = 2 * np.pi * cutoff
+        values = {"R": R, "C": 1 / (wc * R), "L": R / wc}
+    else:
+        low, high = cutoff
+        w0 = 2 * np.pi * np.sqrt(low * high)
+        q = np.sqrt(low * high) / (high - low)
+        if circuit.name == "RLC1":
+            values = {"R": R, "L": q * R / w0, "C": 1 / (w0 * q * R)}
+        else:
+            values = {"R": R, "L": R / (w0 * q), "C": q / (w0 * R)}
+    return {name: float(values[name]) for name in circuit.components}
+
+
+def bilinear_prewarped(num, den, fs, prewarp=None):
+    """Transformación bilineal con predistorsión, vectorizada sobre (..., 3).
+
+    s = K·(1 - z⁻¹)/(1 + z⁻¹) con K = ω/tan(ω/2fs): la respuesta digital
+    coincide con la analógica exactamente en `prewarp` (rad/s). Por defecto
+    se predistorsiona en la frecuencia natural de cada filtro. Devuelve
+    (b, a) normalizados con a[..., 0] = 1 y forma (..., 3).
+    """
+    if prewarp is None:
+        prewarp = natural_frequency(den)
+    # Por encima de Nyquist la predistorsión no tiene sentido: se recorta
+    prewarp = np.minimum(prewarp, 0.99 * np.pi * fs)
+    K = np.asarray(prewarp / np.tan(prewarp / (2 * fs)))[..., None]
+
+    def transform(p):
+        p2, p1, p0 = p[..., 0:1], p[..., 1:2], p[..., 2:3]
+        return np.concatenate([
+            p2 * K**2 + p1 * K + p0,
+            2 * (p0 - p2 * K**2),
+            p2 * K**2 - p1 * K + p0,
+        ], -1)
+
+    b = transform(num)
+    a = transform(den)
+    return b / a[..., :1], a / a[..., :1]
+
+
+def circuit_filter(circuit, values, fs):
+    """Coeficientes (b, a) digitales de un circuito con sus valores nominales."""
+    num, den = analog_coefficients(circuit, values)
+    b, a = bilinear_prewarped(num, den, fs)
+    # En 1er orden ambos polinomios comparten el factor (1 + z⁻¹)
+    if circuit.order == 1:
+        b, a = np.polydiv(b, [1, 1])[0], np.polydiv(a, [1, 1])[0]
+    return b, a
+
+
+def response_db(b, a, freqs, fs):
+    """Ganancia (dB) de muchos filtros (..., 3) a la vez sobre `freqs` (Hz)."""
+    powers = np.exp(-2j * np.pi * np.asarray(freqs)[:, None] / fs * np.arange(3))   # (F, 3)
+    h = (b @ powers.T) / (a @ powers.T)
+    with np.errstate(divide='ignore'):
+        return 20 * np.log10(np.abs(h))
+
+
+@dataclass
+class ToleranceResult:
+    # Sorteos de componentes y la dispersión resultante del filtro
+    values: dict
+    cutoffs: np.ndarray        # (N,) o (N, 2) en Hz
+    freqs: np.ndarray
+    gain_db: np.ndarray        # (N, F)
+
+    def percentiles(self, q=(5, 50, 95)):
+        """Percentiles de corte(s) y de la curva de ganancia sobre los sorteos."""
+        return np.percentile(self.cutoffs, q, axis=0), np.percentile(self.gain_db, q, axis=0)
+
+
+def tolerance_analysis(circuit, values, fs, freqs, tolerances=None, draws=DEFAULT_DRAWS, seed=None):
+    """Monte-Carlo de tolerancias de componentes, en una sola pasada vectorizada.
+
+    Cada componente se sortea uniforme dentro de ±tolerancia de su valor
+    nominal; los `draws` circuitos se modelan, discretizan y evalúan juntos.
+    """
+    tolerances = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+    rng = np.random.default_rng(seed)
+    drawn = {
+        name: values[name] * (1 + tolerances[name] * rng.uniform(-1, 1, draws))
+        for name in circuit.components
+    }
+    num, den = analog_coefficients(circuit, drawn)
+    b, a = bilinear_prewarped(num, den, fs)
+    return ToleranceResult(
+        values=drawn,
+        cutoffs=cutoff_frequencies(circuit, drawn),
+        freqs=np.asarray(freqs),
+        gain_db=response_db(b, a, freqs, fs),
+    )
@@ -0,0 +1,152 @@
+import io
+import json
+import struct
+import zipfile
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+
+from .params import SimulationParams
+
+EXPORT_FORMATS = ["npz", "parquet"]
+
+# Series temporales (todas de la misma longitud) y espectros recortados
+SERIES = ("t", "signal_clean", "noise", "signal_input", "signal_filtered")
+SPECTRA = ("freqs", "spectrum_input", "spectrum_filtered")
+COEFFICIENTS = ("b", "a", "sos")
+
+# Clave de los metadatos propios en el esquema de Parquet
+PARQUET_METADATA_KEY = b"simulador_filtros"
+
+# Cabecera local de un miembro ZIP: 30 bytes fijos + nombre + campo extra
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+def result_arrays(result):
+    """Arreglos de un SimulationResult listos para guardar, por nombre."""
+    design = result.design
+    arrays = {name: np.asarray(getattr(result, name)) for name in SERIES + SPECTRA}
+    # Los coeficientes que no usa la estructura elegida (None en FilterDesign)
+    # se guardan como arreglos vacíos con la forma esperada
+    arrays["b"] = np.asarray(design.b) if design.b is not None else np.empty(0)
+    arrays["a"] = np.asarray(design.a) if design.a is not None else np.empty(0)
+    arrays["sos"] = np.asarray(design.sos) if design.sos is not None else np.empty((0, 6))
+    return arrays
+
+
+def params_to_json(params):
+    return json.dumps(asdict(params), ensure_ascii=False)
+
+
+def params_from_json(text):
+    fields = json.loads(text)
+    # JSON no distingue tuplas: el corte Pasa-Banda vuelve como lista
+    if isinstance(fields["cutoff"], list):
+        fields["cutoff"] = tuple(fields["cutoff"])
+    return SimulationParams(**fields)
+
+
+def save_npz(file, result, params, compressed=False):
+    """Guarda la corrida en .npz (ruta o archivo abierto).
+
+    Sin comprimir cada arreglo queda almacenado tal cual dentro del ZIP, lo
+    que permite que load_run lo mapee en memoria en lugar de leerlo.
+    """
+    save = np.savez_compressed if compressed else np.savez
+    save(file, params=np.array(params_to_json(params)), **result_arrays(result))
+
+
+def save_parquet(file, result, params):
+    """Guarda las series temporales como columnas de Parquet.
+
+    Espectros, coeficientes y parámetros son cortos y van como JSON en los
+    metadatos del esquema. Requiere pyarrow.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrays = result_arrays(result)
+    table = pa.table({name: arrays[name] for name in SERIES})
+    extra = {name: arrays[name].tolist() for name in SPECTRA + COEFFICIENTS}
+    extra["params"] = asdict(params)
+    table = table.replace_schema_metadata({PARQUET_METADATA_KEY: json.dumps(extra, ensure_ascii=False)})
+    pq.write_table(table, file)
+
+
+def export_bytes(result, params, fmt="npz", compressed=False):
+    """Contenido del archivo exportado, para descargarlo desde la interfaz.
+
+    El .npz sale sin comprimir salvo que se pida: así load_run lo puede mapear.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportación desconocido: {fmt}")
+    buffer = io.BytesIO()
+    if fmt == "npz":
+        save_npz(buffer, result, params, compressed=compressed)
+    else:
+        save_parquet(buffer, result, params)
+    return buffer.getvalue()
+
+
+def _mmap_npz_member(path, info):
+    # Ubica los datos del .npy dentro del ZIP y los mapea sin copiarlos
+    with open(path, "rb") as fh:
+        fh.seek(info.header_offset)
+        header = _ZIP_LOCAL_HEADER.unpack(fh.read(_ZIP_LOCAL_HEADER.size))
+        name_length, extra_length = header[-2:]
+        fh.seek(name_length + extra_length, 1)
+        version = np.lib.format.read_magic(fh)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fh)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fh)
+        offset = fh.tell()
+    if dtype.hasobject:
+        return None
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+    order = "F" if fortran_order else "C"
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape, order=order)
+
+
+def _load_npz(path, mmap):
+    arrays = {}
+    with np.load(path) as npz, zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            name = info.filename.removesuffix(".npy")
+            array = None
+            # Solo los miembros sin comprimir se pueden mapear en memoria
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                array = _mmap_npz_member(path, info)
+            arrays[name] = npz[name] if array is None else array
+    params = params_from_json(str(arrays.pop("params")))
+    return arrays, params
+
+
+def _load_parquet(path, mmap):
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path, memory_map=mmap)
+    extra = json.loads(table.schema.metadata[PARQUET_METADATA_KEY])
+    # Columnas float sin nulos: to_numpy no copia los datos
+    arrays = {name: table.column(name).to_numpy() for name in SERIES}
+    for name in SPECTRA + COEFFICIENTS:
+        arrays[name] = np.asarray(extra[name], dtype=float)
+    arrays["sos"] = arrays["sos"].reshape(-1, 6)
+    return arrays, params_from_json(json.dumps(extra["params"]))
+
+
+def load_run(path, mmap=True):
+    """Carga una corrida guardada con save_npz o save_parquet.
+
+    Devuelve (arreglos, parámetros). Con `mmap` los arreglos de un .npz sin
+    comprimir quedan mapeados en memoria (np.memmap): se pueden volver a
+    graficar o filtrar por bloques sin cargar el archivo entero en RAM. Los
+    Parquet se leen con el archivo mapeado, pero pyarrow descomprime las
+    columnas.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return _load_parquet(path, mmap)
+    return _load_npz(path, mmap)
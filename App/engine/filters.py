@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from scipy import signal
+
+from .params import FILTER_BTYPES
+
+# Cantidad máxima de diseños guardados en la caché del proceso
+DESIGN_CACHE_SIZE = 256
+
+# A partir de este orden, o con bandas/cortes más angostos que esta fracción
+# de Nyquist, la forma (b, a) pierde precisión y se usan secciones de 2º orden
+SOS_ORDER_THRESHOLD = 5
+SOS_BANDWIDTH_THRESHOLD = 0.05
+
+FILTER_STRUCTURES = ["auto", "ba", "sos"]
+
+
+@dataclass(frozen=True)
+class FilterDesign:
+    # Coeficientes del filtro (solo lectura). En la estructura "sos" b y a
+    # quedan en None y se usa `sos`. La respuesta en frecuencia se pide aparte
+    # (get_bode_response), solo en la banda que se muestra. `method` es el
+    # diseño FIR que se usó realmente ("firwin"/"remez"); None en los IIR.
+    structure: str
+    b: np.ndarray
+    a: np.ndarray
+    sos: np.ndarray
+    method: str = None
+
+
+def normalize_cutoff(cutoff, fs):
+    # Frecuencia(s) de corte normalizadas respecto de Nyquist
+    nyquist = fs / 2
+    if isinstance(cutoff, (tuple, list)):
+        return [c / nyquist for c in cutoff]
+    return cutoff / nyquist
+
+
+def needs_sos(order, cutoff, fs):
+    # Criterio de estabilidad numérica para elegir la estructura en modo "auto"
+    if order >= SOS_ORDER_THRESHOLD:
+        return True
+    normal = normalize_cutoff(cutoff, fs)
+    if isinstance(normal, list):
+        low, high = normal
+        return (high - low) < SOS_BANDWIDTH_THRESHOLD or low < SOS_BANDWIDTH_THRESHOLD
+    return normal < SOS_BANDWIDTH_THRESHOLD or normal > 1 - SOS_BANDWIDTH_THRESHOLD
+
+
+def resolve_structure(structure, order, cutoff, fs):
+    if structure == "auto":
+        return "sos" if needs_sos(order, cutoff, fs) else "ba"
+    if structure not in FILTER_STRUCTURES:
+        raise ValueError(f"Estructura de filtro desconocida: {structure}")
+    return structure
+
+
+def design_filter(filter_type, order, cutoff, fs, output="ba"):
+    """Diseña un Butterworth digital en forma (b, a) o como secciones SOS."""
+    btype = FILTER_BTYPES[filter_type]
+    return signal.butter(order, normalize_cutoff(cutoff, fs), btype=btype, analog=False, output=output)
+
+
+def apply_filter(b, a, x):
+    # Filtrado de fase cero (ida y vuelta)
+    return signal.filtfilt(b, a, x)
+
+
+def apply_sos_filter(sos, x):
+    # Filtrado de fase cero en cascada de secciones de 2º orden.
+    # sosfilt exige un buffer escribible; la copia de `sos` es despreciable.
+    return signal.sosfiltfilt(np.array(sos), x)
+
+
+def apply_fir(taps, x):
+    # Convolución overlap-add por FFT; "same" descuenta el retardo de fase lineal
+    return signal.oaconvolve(x, taps, mode="same")
+
+
+def apply_design(design, x):
+    if design.structure == "fir":
+        return apply_fir(design.b, x)
+    if design.structure == "sos":
+        return apply_sos_filter(design.sos, x)
+    return apply_filter(design.b, design.a, x)
+
+
+def frequency_response(b, a, fs, worN=8000):
+    return signal.freqz(b, a, worN=worN, fs=fs)
+
+
+def sos_frequency_response(sos, fs, worN=8000):
+    return signal.sosfreqz(sos, worN=worN, fs=fs)
+
+
+@lru_cache(maxsize=DESIGN_CACHE_SIZE)
+def _cached_design(filter_type, order, cutoff, fs, structure):
+    if structure == "sos":
+        b = a = None
+        sos = design_filter(filter_type, order, cutoff, fs, output="sos")
+    else:
+        sos = None
+        b, a = design_filter(filter_type, order, cutoff, fs)
+
+    # Los arreglos se comparten entre sesiones: evitar que alguien los modifique
+    for arr in (b, a, sos):
+        if arr is not None:
+            arr.flags.writeable = False
+    return FilterDesign(structure=structure, b=b, a=a, sos=sos)
+
+
+def get_filter_design(filter_type, order, cutoff, fs, structure="auto"):
+    """Devuelve el diseño del filtro, memoizado.
+
+    La caché es compartida por todas las sesiones del proceso, de modo que
+    mover un control que no afecta al filtro no vuelve a llamar a butter.
+    Con `structure="auto"` se usan secciones SOS cuando el orden o el ancho
+    de banda superan los umbrales de estabilidad.
+    """
+    if isinstance(cutoff, list):
+        cutoff = tuple(cutoff)
+    structure = resolve_structure(structure, order, cutoff, fs)
+    return _cached_design(filter_type, int(order), cutoff, fs, structure)
+
+
+def design_cache_info():
+    # (hits, misses, maxsize, currsize) de la caché de diseños
+    return _cached_design.cache_info()
+
+
+def clear_design_cache():
+    _cached_design.cache_clear()
@@ -0,0 +1,189 @@
+import time
+from functools import lru_cache
+
+import numpy as np
+from scipy import fft, signal
+
+from .filters import DESIGN_CACHE_SIZE, FilterDesign, apply_design, get_filter_design
+from .metrics import snr_db
+from .streaming import iter_chunks
+
+# Métodos de diseño: IIR Butterworth (el de siempre) o FIR de fase lineal
+DESIGN_METHODS = ["iir", "firwin", "remez"]
+
+# Estimación automática de coeficientes: atenuación buscada (dB) y ancho de
+# la transición como fracción del margen libre alrededor de cada corte
+FIR_ATTENUATION_DB = 60
+FIR_TRANSITION_FRACTION = 0.25
+FIR_MAX_TAPS = 4095
+# remez converge mal (y muy lento) con filtros largos
+REMEZ_MAX_TAPS = 1023
+
+# Por debajo de estas operaciones la convolución directa se incluye en la
+# comparación; por encima tardaría demasiado
+DIRECT_CONVOLUTION_MAX_OPS = 2e8
+
+
+def _transition_width(filter_type, cutoff, fs, numtaps=None):
+    # Margen hasta 0, Nyquist (y entre bordes de la banda) alrededor de cada corte
+    nyquist = fs / 2
+    if filter_type == "Pasa-Banda":
+        low, high = cutoff
+        room = min(low, (high - low) / 2, nyquist - high)
+    else:
+        room = min(cutoff, nyquist - cutoff)
+    width = FIR_TRANSITION_FRACTION * room
+    if numtaps:
+        # Con menos coeficientes que los estimados la transición se ensancha
+        # (fórmula de Kaiser), sin invadir la banda vecina
+        implied = (FIR_ATTENUATION_DB - 7.95) / (2.285 * 2 * np.pi * (numtaps - 1)) * fs
+        width = min(max(width, implied), 1.8 * room)
+    return width
+
+
+def fir_numtaps(filter_type, cutoff, fs, method="firwin"):
+    """Cantidad de coeficientes (impar) para la transición y atenuación por defecto."""
+    numtaps, _ = signal.kaiserord(FIR_ATTENUATION_DB, _transition_width(filter_type, cutoff, fs) / (fs / 2))
+    limit = REMEZ_MAX_TAPS if method == "remez" else FIR_MAX_TAPS
+    return min(numtaps | 1, limit)
+
+
+def design_fir(filter_type, numtaps, cutoff, fs, method="firwin"):
+    """Diseña un FIR de fase lineal con firwin (ventana de Kaiser) o remez.
+
+    `numtaps` se fuerza a impar (tipo I), que admite los tres tipos de filtro
+    y tiene un retardo entero de (numtaps - 1) / 2 muestras.
+    """
+    numtaps = int(numtaps) | 1
+    width = _transition_width(filter_type, cutoff, fs, numtaps)
+    if method == "firwin":
+        _, beta = signal.kaiserord(FIR_ATTENUATION_DB, width / (fs / 2))
+        pass_zero = {"Pasa-Bajo": "lowpass", "Pasa-Alto": "highpass", "Pasa-Banda": "bandpass"}[filter_type]
+        return signal.firwin(numtaps, cutoff, window=("kaiser", beta), pass_zero=pass_zero, fs=fs)
+    if method == "remez":
+        nyquist = fs / 2
+        if filter_type == "Pasa-Bajo":
+            bands, desired = [0, cutoff - width / 2, cutoff + width / 2, nyquist], [1, 0]
+        elif filter_type == "Pasa-Alto":
+            bands, desired = [0, cutoff - width / 2, cutoff + width / 2, nyquist], [0, 1]
+        else:
+            low, high = cutoff
+            bands = [0, low - width / 2, low + width / 2, high - width / 2, high + width / 2, nyquist]
+            desired = [0, 1, 0]
+        return signal.remez(numtaps, bands, desired, fs=fs)
+    raise ValueError(f"Método de diseño FIR desconocido: {method}")
+
+
+@lru_cache(maxsize=DESIGN_CACHE_SIZE)
+def _cached_fir_design(filter_type, numtaps, cutoff, fs, method):
+    try:
+        b = design_fir(filter_type, numtaps, cutoff, fs, method)
+    except ValueError:
+        if method != "remez":
+            raise
+        # remez no converge con transiciones angostas cerca de 0 Hz (p. ej.
+        # pasa-altos de pocos Hz); en ese caso se diseña con firwin
+        method = "firwin"
+        b = design_fir(filter_type, numtaps, cutoff, fs, method)
+    a = np.ones(1)
+    for arr in (b, a):
+        arr.flags.writeable = False
+    return FilterDesign(structure="fir", b=b, a=a, sos=None, method=method)
+
+
+def get_fir_design(filter_type, numtaps, cutoff, fs, method="firwin"):
+    """Diseño FIR memoizado; con numtaps None se estima la cantidad de coeficientes.
+
+    Si remez no converge se usa firwin: `design.method` indica cuál se aplicó.
+    """
+    if isinstance(cutoff, list):
+        cutoff = tuple(cutoff)
+    if not numtaps:
+        numtaps = fir_numtaps(filter_type, cutoff, fs, method)
+    return _cached_fir_design(filter_type, int(numtaps) | 1, cutoff, fs, method)
+
+
+def fir_block_size(numtaps, n):
+    """Bloque de entrada para overlap-add que minimiza el costo por muestra.
+
+    Con una FFT de largo nfft cada bloque aporta nfft - numtaps + 1 muestras
+    nuevas a un costo ~ nfft·log(nfft): se prueban largos "rápidos" desde
+    2·numtaps hasta cubrir toda la señal y se elige el más barato.
+    """
+    best, best_cost = None, np.inf
+    nfft = fft.next_fast_len(2 * numtaps, real=True)
+    limit = fft.next_fast_len(n + numtaps - 1, real=True)
+    while True:
+        block = nfft - numtaps + 1
+        cost = nfft * np.log2(nfft) / min(block, n)
+        if cost < best_cost:
+            best, best_cost = block, cost
+        if nfft >= limit:
+            break
+        nfft = fft.next_fast_len(2 * nfft, real=True)
+    return min(best, n)
+
+
+def fir_filter_in_chunks(taps, x, block_size=None, zero_phase=True):
+    """Overlap-add por bloques con FFT, con bloque automático.
+
+    Con `zero_phase` se descuenta el retardo de (numtaps - 1) / 2 muestras
+    (mismo resultado que oaconvolve(..., mode="same")); si no, es causal.
+    """
+    taps = np.asarray(taps)
+    numtaps, n = len(taps), len(x)
+    block_size = block_size or fir_block_size(numtaps, n)
+    nfft = fft.next_fast_len(block_size + numtaps - 1, real=True)
+    spectrum = fft.rfft(taps, nfft)
+    delay = (numtaps - 1) // 2 if zero_phase else 0
+
+    y = np.zeros(n)
+    for start, stop in iter_chunks(n, block_size):
+        segment = fft.irfft(fft.rfft(x[start:stop], nfft) * spectrum, nfft)[:stop - start + numtaps - 1]
+        first = start - delay
+        lo, hi = max(first, 0), min(first + len(segment), n)
+        if hi > lo:
+            y[lo:hi] += segment[lo - first:hi - first]
+    return y
+
+
+def _best_time(func, repeat=3):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = func()
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def compare_fir_iir(params, signal_clean, signal_input, method="firwin", numtaps=None):
+    """Filtra la misma entrada con el IIR de la página y con un FIR; mide ambos.
+
+    Devuelve una fila por variante con el tiempo (mejor de 3), el tamaño del
+    filtro y la SNR de salida. La convolución directa solo se mide si la
+    cantidad de operaciones es razonable.
+    """
+    iir = get_filter_design(params.filter_type, params.order, params.cutoff, params.fs, structure=params.structure)
+    fir = get_fir_design(params.filter_type, numtaps, params.cutoff, params.fs, method)
+    taps = np.array(fir.b)
+
+    variants = [
+        ("IIR Butterworth (ida y vuelta)", f"orden {params.order}", lambda: apply_design(iir, signal_input)),
+        ("FIR overlap-add (oaconvolve)", f"{len(taps)} coeficientes", lambda: apply_design(fir, signal_input)),
+    ]
+    if len(taps) * len(signal_input) <= DIRECT_CONVOLUTION_MAX_OPS:
+        variants.append((
+            "FIR convolución directa", f"{len(taps)} coeficientes",
+            lambda: signal.convolve(signal_input, taps, mode="same", method="direct"),
+        ))
+
+    rows = []
+    for name, size, func in variants:
+        seconds, out = _best_time(func)
+        rows.append({
+            "variant": name,
+            "size": size,
+            "seconds": seconds,
+            "snr_out_db": float(snr_db(signal_clean, out - signal_clean)),
+        })
+    return rows
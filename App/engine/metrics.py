@@ -0,0 +1,29 @@
+import numpy as np
+
+
+def power_db(ratio):
+    # 10·log10 sin advertencias para razones nulas o infinitas
+    with np.errstate(divide='ignore'):
+        return 10 * np.log10(ratio)
+
+
+def snr_db(reference, error, axis=-1):
+    """Relación señal/ruido (dB) entre una referencia y un error aditivo."""
+    return power_db(np.mean(reference**2, axis=axis) / np.mean(error**2, axis=axis))
+
+
+def confidence_interval(values, confidence=0.95):
+    """Media e intervalo de confianza (t de Student) de una muestra.
+
+    Devuelve (media, inferior, superior). Con menos de dos valores el
+    intervalo se reduce a la media.
+    """
+    # scipy.stats es pesado de importar y solo lo usa el modo Monte-Carlo
+    from scipy import stats
+
+    values = np.asarray(values, dtype=float)
+    mean = float(values.mean()) if len(values) else np.nan
+    if len(values) < 2:
+        return mean, mean, mean
+    half_width = float(stats.t.ppf((1 + confidence) / 2, len(values) - 1) * stats.sem(values))
+    return mean, mean - half_width, mean + half_width
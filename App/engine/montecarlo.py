@@ -0,0 +1,84 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from .metrics import confidence_interval, snr_db
+from .pipeline import simulate
+
+# Tareas por proceso: agrupar realizaciones amortiza el costo de enviar
+# parámetros y resultados entre procesos
+BATCHES_PER_WORKER = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Realisation:
+    seed: int
+    snr_in_db: float
+    snr_out_db: float
+    residual_rms: float
+
+
+def get_executor():
+    """Pool de procesos compartido por todo el proceso (se crea una vez).
+
+    Los procesos salen de un forkserver y no de fork: el servidor de
+    Streamlit tiene varios hilos y un fork puede copiar locks tomados.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("forkserver")
+            )
+        return _executor
+
+
+def run_realisation(params, seed):
+    # Cada realización usa su propia semilla: el resultado es reproducible.
+    # El ruido no pasa por el banco: cada semilla se usa una sola vez.
+    result = simulate(replace(params, seed=seed), bank=None)
+    error = result.signal_filtered - result.signal_clean
+    return Realisation(
+        seed=seed,
+        snr_in_db=float(snr_db(result.signal_clean, result.noise)),
+        snr_out_db=float(snr_db(result.signal_clean, error)),
+        residual_rms=float(np.sqrt(np.mean(error**2))),
+    )
+
+
+def _run_batch(params, seeds):
+    return [run_realisation(params, seed) for seed in seeds]
+
+
+def run_monte_carlo(params, n_runs, base_seed=0, executor=None):
+    """Ejecuta n_runs realizaciones con semillas base_seed..base_seed+n_runs-1.
+
+    Es un generador: devuelve las realizaciones a medida que terminan los
+    lotes en el pool de procesos, en orden de llegada y no de semilla.
+    """
+    executor = executor or get_executor()
+    workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+    seeds = np.arange(base_seed, base_seed + n_runs)
+    batches = [b.tolist() for b in np.array_split(seeds, min(n_runs, workers * BATCHES_PER_WORKER)) if len(b)]
+
+    futures = [executor.submit(_run_batch, params, batch) for batch in batches]
+    for future in as_completed(futures):
+        yield from future.result()
+
+
+def summarize(realisations, confidence=0.95):
+    """Media e intervalo de confianza de la SNR de entrada, salida y su mejora."""
+    snr_in = np.array([r.snr_in_db for r in realisations])
+    snr_out = np.array([r.snr_out_db for r in realisations])
+    return {
+        "snr_in_db": confidence_interval(snr_in, confidence),
+        "snr_out_db": confidence_interval(snr_out, confidence),
+        "snr_improvement_db": confidence_interval(snr_out - snr_in, confidence),
+    }
@@ -0,0 +1,80 @@
+from functools import lru_cache
+
+import numpy as np
+from scipy import signal
+
+from .signals import NARROWBAND_HALF_WIDTH
+from .spectrum import DISPLAY_MAX_FREQ
+from .streaming import sample_count
+
+# La tasa reducida debe cubrir la banda de interés con este margen: entre la
+# banda y el nuevo Nyquist queda la transición del filtro antialias
+MULTIRATE_MARGIN = 2.5
+
+# Coeficientes del antialias por cada unidad del factor, a cada lado (como
+# resample_poly) y ventana de Kaiser
+ANTI_ALIAS_HALF_LEN = 10
+ANTI_ALIAS_WINDOW = ("kaiser", 5.0)
+
+
+def band_of_interest(params):
+    # Lo que se muestra y analiza: el rango de los gráficos, el corte más alto
+    # y el ruido senoidal o de banda estrecha, que el antialias no debe quitar
+    cutoff = max(params.cutoff) if isinstance(params.cutoff, (tuple, list)) else params.cutoff
+    noise = params.freq_noise
+    if params.noise_type == "Ruido banda estrecha":
+        noise += NARROWBAND_HALF_WIDTH
+    elif params.noise_type != "Seno con fase aleatoria":
+        noise = 0.0
+    return max(DISPLAY_MAX_FREQ, cutoff, noise)
+
+
+def padding_length(params):
+    # Relleno de bordes de filtfilt/sosfiltfilt (3 muestras por coeficiente):
+    # la señal diezmada tiene que ser más larga
+    poles = 2 * params.order if params.filter_type == "Pasa-Banda" else params.order
+    return 3 * (2 * poles + 1)
+
+
+def multirate_factor(params):
+    """Factor de diezmado entero; 1 si el modo multitasa está apagado o no conviene.
+
+    El factor se limita para que a la tasa reducida queden más muestras que
+    el relleno de bordes del filtrado de fase cero.
+    """
+    if not params.multirate:
+        return 1
+    q = int(params.fs // (MULTIRATE_MARGIN * band_of_interest(params)))
+    n = sample_count(params.fs, params.duration)
+    return max(1, min(q, (n - 1) // padding_length(params)))
+
+
+def analysis_rate(params):
+    # Frecuencia de muestreo a la que se diseña y aplica el filtro
+    return params.fs / multirate_factor(params)
+
+
+@lru_cache(maxsize=64)
+def anti_alias_taps(q):
+    """FIR antialias (ganancia unitaria) para diezmar o interpolar por q.
+
+    Es el mismo diseño que usa resample_poly por defecto, pero memoizado: con
+    factores grandes firwin cuesta más que el propio remuestreo.
+    """
+    taps = signal.firwin(2 * ANTI_ALIAS_HALF_LEN * q + 1, 1 / q, window=ANTI_ALIAS_WINDOW)
+    taps.flags.writeable = False
+    return taps
+
+
+def decimate(x, q, axis=-1):
+    """Diezma por q con resample_poly (polifase, sin calcular las muestras descartadas)."""
+    if q == 1:
+        return x
+    return signal.resample_poly(x, 1, q, axis=axis, window=np.array(anti_alias_taps(q)))
+
+
+def interpolate(x, q, n):
+    """Vuelve a la tasa original (x q) y recorta a n muestras."""
+    if q == 1:
+        return x
+    return signal.resample_poly(x, q, 1, window=np.array(anti_alias_taps(q)))[:n]
@@ -0,0 +1,63 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Memoria máxima que puede ocupar el banco de ruido del proceso
+DEFAULT_BANK_BYTES = 256 * 1024**2
+
+
+@dataclass(frozen=True)
+class BankInfo:
+    hits: int
+    misses: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+class NoiseBank:
+    """Caché LRU de vectores de ruido, acotada por bytes y no por cantidad.
+
+    Cada vector se genera una sola vez por clave y se guarda en solo lectura;
+    quien lo usa solo le aplica la amplitud. Los vectores más grandes que el
+    presupuesto completo se generan pero no se guardan.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_BANK_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, factory):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        noise = factory()
+        noise.flags.writeable = False
+        if noise.nbytes > self.max_bytes:
+            return noise
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = noise
+                self._nbytes += noise.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+        return noise
+
+    def info(self):
+        with self._lock:
+            return BankInfo(self._hits, self._misses, len(self._entries), self._nbytes, self.max_bytes)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
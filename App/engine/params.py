@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+# Tipos de filtro tal como los muestran las páginas, y su equivalente en scipy
+FILTER_BTYPES = {
+    "Pasa-Bajo": "low",
+    "Pasa-Alto": "high",
+    "Pasa-Banda": "band",
+}
+
+WAVEFORM_TYPES = ["Sinusoidal", "Cuadrada", "Diente de sierra"]
+NOISE_TYPES = ["Blanco", "Seno con fase aleatoria", "Ruido banda estrecha"]
+
+
+@dataclass(frozen=True)
+class SimulationParams:
+    """Parámetros de una simulación completa (señal + ruido + filtro).
+
+    `cutoff` es un único valor en Hz para Pasa-Bajo/Pasa-Alto y una tupla
+    (inferior, superior) para Pasa-Banda. `structure` elige entre la forma
+    (b, a), secciones de 2º orden ("sos") o la selección automática.
+    Con `streaming` la señal se genera y filtra por bloques con sosfilt; si
+    además `zero_phase` está activo se agrega una pasada hacia atrás.
+    `seed` hace reproducible el ruido; con None cambia en cada corrida.
+    `method` elige el Butterworth IIR ("iir") o un FIR de fase lineal
+    ("firwin"/"remez"); para los FIR `numtaps` None estima los coeficientes.
+    Con `multirate` la señal se diezma a la menor tasa que cubre la banda
+    mostrada antes de filtrar; `upsample` devuelve la salida a `fs`.
+    """
+
+    filter_type: str
+    order: int
+    cutoff: object
+    waveform_type: str = "Sinusoidal"
+    noise_type: str = "Blanco"
+    amplitude_signal: float = 1.0
+    freq_signal: float = 10.0
+    amplitude_noise: float = 0.3
+    freq_noise: float = 50.0
+    fs: int = 1000
+    structure: str = "auto"
+    duration: float = 1.0
+    streaming: bool = False
+    zero_phase: bool = True
+    seed: int = None
+    method: str = "iir"
+    numtaps: int = None
+    multirate: bool = False
+    upsample: bool = False
+
+    @property
+    def btype(self):
+        return FILTER_BTYPES[self.filter_type]
@@ -0,0 +1,319 @@
+import tempfile
+from dataclasses import dataclass, fields, replace
+from functools import partial
+
+import numpy as np
+
+from .filters import FilterDesign, apply_design, get_filter_design
+from .fir import fir_filter_in_chunks, get_fir_design
+from .graph import PipelineGraph, Stage
+from .multirate import analysis_rate, decimate, interpolate, multirate_factor
+from .params import SimulationParams
+from .signals import NOISE_BANK, generate_noise, generate_waveform, time_vector
+from .spectral import IncrementalSpectrogram, nperseg_for, segment_count, segment_plan
+from .spectrum import compute_spectrum
+from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    check_in_memory,
+    filter_in_chunks,
+    generate_chunks,
+    sample_count,
+    stream_filter,
+    zero_phase_pass,
+)
+
+
+@dataclass
+class SimulationResult:
+    t: np.ndarray
+    signal_clean: np.ndarray
+    noise: np.ndarray
+    signal_input: np.ndarray
+    signal_filtered: np.ndarray
+    design: FilterDesign
+    freqs: np.ndarray
+    spectrum_input: np.ndarray
+    spectrum_filtered: np.ndarray
+    spectrograms: dict = None
+
+
+def _time_stage(params):
+    check_in_memory(params.fs, params.duration)
+    return time_vector(params.fs, params.duration)
+
+
+def _signal_stage(params, t):
+    return generate_waveform(params.waveform_type, params.amplitude_signal, params.freq_signal, t)
+
+
+def _noise_stage(params, t, bank=NOISE_BANK):
+    return generate_noise(
+        params.noise_type, params.amplitude_noise, params.freq_noise, t, params.fs, seed=params.seed, bank=bank
+    )
+
+
+def _sum_stage(params, signal_clean, noise):
+    return signal_clean + noise
+
+
+def _front_stage(params, t, signal_clean, noise, signal_input):
+    # Etapa multitasa: diezma a la menor tasa que cubre la banda de interés.
+    # La entrada es lineal, así que alcanza con diezmar señal y ruido.
+    q = multirate_factor(params)
+    if q == 1:
+        return t, signal_clean, noise, signal_input
+    signal_clean, noise = decimate(np.stack([signal_clean, noise]), q)
+    return t[::q], signal_clean, noise, signal_clean + noise
+
+
+def _design_stage(params):
+    # Con multitasa el filtro se diseña a la tasa reducida
+    fs = analysis_rate(params)
+    if params.method != "iir":
+        return get_fir_design(params.filter_type, params.numtaps, params.cutoff, fs, params.method)
+    # En modo por bloques se filtra con sosfilt, que requiere secciones SOS
+    structure = "sos" if params.streaming else params.structure
+    return get_filter_design(params.filter_type, params.order, params.cutoff, fs, structure=structure)
+
+
+def _filter_stage(params, design, front):
+    signal_input = front[3]
+    if params.streaming and design.structure == "fir":
+        return fir_filter_in_chunks(design.b, signal_input, zero_phase=params.zero_phase)
+    if params.streaming:
+        return filter_in_chunks(design.sos, signal_input, zero_phase=params.zero_phase)
+    return apply_design(design, signal_input)
+
+
+def _output_stage(params, t, signal_clean, noise, signal_input, front, signal_filtered):
+    # Series alineadas que ven los espectros, los gráficos y el resultado:
+    # a la tasa reducida, o a la original si se pidió interpolar la salida
+    q = multirate_factor(params)
+    if q > 1 and params.upsample:
+        return t, signal_clean, noise, signal_input, interpolate(signal_filtered, q, len(t)), params.fs
+    return (*front, signal_filtered, params.fs / q)
+
+
+# Resolución (Hz) y columnas guardadas de los espectrogramas por bloques
+STREAM_SPECTRAL_RESOLUTION = 1.0
+STREAM_SPECTROGRAM_MAX_FRAMES = 4096
+
+
+def stream_spectrograms(fs, n, block_size=DEFAULT_CHUNK_SIZE):
+    """Espectrogramas incrementales de la entrada y de la salida filtrada.
+
+    Se alimentan bloque a bloque con update(); psd() da la PSD de Welch de
+    toda la señal y window() las últimas columnas calculadas.
+    """
+    nperseg = nperseg_for(fs, STREAM_SPECTRAL_RESOLUTION, n)
+    plan = segment_plan(nperseg, nperseg // 2, fs)
+    max_frames = max(1, min(segment_count(n, plan), STREAM_SPECTROGRAM_MAX_FRAMES))
+    return {name: IncrementalSpectrogram(plan, max_frames, block_size) for name in ("signal_input", "signal_filtered")}
+
+
+def _feed_in_chunks(spectrogram, x, chunk_size=DEFAULT_CHUNK_SIZE):
+    for start in range(0, len(x), chunk_size):
+        spectrogram.update(x[start:start + chunk_size])
+
+
+def spectra_from_spectrograms(spectrograms):
+    # Raíz de la PSD de Welch acumulada (V/√Hz), en arreglos propios
+    freqs = spectrograms["signal_input"].plan.freqs
+    return freqs, np.sqrt(spectrograms["signal_input"].psd()), np.sqrt(spectrograms["signal_filtered"].psd())
+
+
+def _spectrograms_stage(params, output):
+    # Por bloques los espectros se acumulan segmento a segmento, como en
+    # simulate_streaming; en memoria se usa el |FFT| de toda la señal
+    if not params.streaming:
+        return None
+    _, _, _, signal_input, signal_filtered, fs = output
+    spectrograms = stream_spectrograms(fs, len(signal_input))
+    _feed_in_chunks(spectrograms["signal_input"], signal_input)
+    _feed_in_chunks(spectrograms["signal_filtered"], signal_filtered)
+    return spectrograms
+
+
+def _spectra_stage(params, output, spectrograms):
+    if spectrograms is not None:
+        return spectra_from_spectrograms(spectrograms)
+    _, _, _, signal_input, signal_filtered, fs = output
+    return compute_spectrum(signal_input, signal_filtered, fs)
+
+
+# Etapas de la simulación:
+# señal → ruido → suma → multitasa → diseño → filtro → salida → espectros
+SIMULATION_STAGES = [
+    Stage("time", _time_stage, fields=("fs", "duration")),
+    Stage("signal", _signal_stage, fields=("waveform_type", "amplitude_signal", "freq_signal"), deps=("time",)),
+    Stage(
+        "noise", _noise_stage,
+        fields=("noise_type", "amplitude_noise", "freq_noise", "seed"), deps=("time",),
+        volatile=lambda params: params.seed is None,
+    ),
+    Stage("sum", _sum_stage, deps=("signal", "noise")),
+    Stage(
+        "front", _front_stage,
+        fields=("multirate", "filter_type", "cutoff", "order"), deps=("time", "signal", "noise", "sum"),
+    ),
+    Stage(
+        "design", _design_stage,
+        fields=(
+            "filter_type", "order", "cutoff", "fs", "structure", "streaming", "method", "numtaps",
+            "multirate", "duration", "noise_type", "freq_noise",
+        ),
+    ),
+    Stage("filter", _filter_stage, fields=("streaming", "zero_phase"), deps=("design", "front")),
+    Stage(
+        "output", _output_stage,
+        fields=("multirate", "upsample"), deps=("time", "signal", "noise", "sum", "front", "filter"),
+    ),
+    Stage("spectrograms", _spectrograms_stage, fields=("streaming",), deps=("output",)),
+    Stage("spectra", _spectra_stage, deps=("output", "spectrograms")),
+]
+
+
+def make_simulation_graph(extra_stages=(), bank=NOISE_BANK):
+    """Grafo memoizado de la simulación; `extra_stages` agrega etapas propias.
+
+    `bank` es el banco de ruido de la etapa "noise" (None: no guardar el ruido).
+    """
+    stages = [
+        replace(stage, func=partial(_noise_stage, bank=bank)) if stage.name == "noise" else stage
+        for stage in SIMULATION_STAGES
+    ]
+    return PipelineGraph(stages + list(extra_stages))
+
+
+def _stream_stage(params):
+    return simulate_streaming(params)
+
+
+def _stream_design_stage(params, result):
+    return result.design
+
+
+def _stream_output_stage(params, result):
+    return result.t, result.signal_clean, result.noise, result.signal_input, result.signal_filtered, params.fs
+
+
+def _stream_spectrograms_stage(params, result):
+    return result.spectrograms
+
+
+def _stream_spectra_stage(params, spectrograms):
+    return spectra_from_spectrograms(spectrograms)
+
+
+# Modo por bloques: una etapa genera, filtra y resume la señal; las demás
+# exponen sus salidas con los mismos nombres que en SIMULATION_STAGES
+STREAMING_STAGES = [
+    Stage(
+        "stream", _stream_stage,
+        fields=tuple(field.name for field in fields(SimulationParams)),
+        volatile=lambda params: params.seed is None,
+    ),
+    Stage("design", _stream_design_stage, deps=("stream",)),
+    Stage("output", _stream_output_stage, deps=("stream",)),
+    Stage("spectrograms", _stream_spectrograms_stage, deps=("stream",)),
+    Stage("spectra", _stream_spectra_stage, deps=("spectrograms",)),
+]
+
+
+def make_streaming_graph(extra_stages=()):
+    """Grafo del modo por bloques (ver streams_in_blocks).
+
+    Tiene las mismas salidas "design", "output", "spectrograms" y "spectra" que
+    make_simulation_graph, así que admite las mismas etapas extra.
+    """
+    return PipelineGraph(STREAMING_STAGES + list(extra_stages))
+
+
+def result_from_values(values):
+    # Arma un SimulationResult con las salidas de las etapas del grafo
+    t, signal_clean, noise, signal_input, signal_filtered, _ = values["output"]
+    design = values["design"]
+    freqs, spectrum_input, spectrum_filtered = values["spectra"]
+    return SimulationResult(
+        t=t,
+        signal_clean=signal_clean,
+        noise=noise,
+        signal_input=signal_input,
+        signal_filtered=signal_filtered,
+        design=design,
+        freqs=freqs,
+        spectrum_input=spectrum_input,
+        spectrum_filtered=spectrum_filtered,
+        spectrograms=values.get("spectrograms"),
+    )
+
+
+def streams_in_blocks(params):
+    # El modo por bloques de punta a punta es IIR a la tasa original; los FIR
+    # y el multitasa por bloques filtran una señal que ya está en memoria
+    return params.streaming and params.method == "iir" and not params.multirate
+
+
+def simulate(params, bank=NOISE_BANK):
+    """Ejecuta el pipeline completo sin depender de Streamlit."""
+    if streams_in_blocks(params):
+        return simulate_streaming(params)
+    values, _ = make_simulation_graph(bank=bank).run(params)
+    return result_from_values(values)
+
+
+def scratch_array(n):
+    # Arreglo respaldado por un archivo temporal anónimo (en el directorio de
+    # tempfile, p. ej. TMPDIR): ocupa disco y no memoria, y el archivo
+    # desaparece cuando se libera el arreglo
+    return np.memmap(tempfile.TemporaryFile(), dtype=float, mode="w+", shape=(n,))
+
+
+def simulate_streaming(params, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Variante por bloques de simulate: genera y filtra con sosfilt.
+
+    Cada bloque de generate_chunks/stream_filter se escribe en np.memmap
+    sobre archivos temporales, y la pasada de fase cero trabaja sobre ese
+    archivo: la memoria no depende de la duración. Los bloques alimentan
+    también los espectrogramas incrementales (stream_spectrograms), de los
+    que salen los espectros: la raíz de la PSD de Welch (V/√Hz).
+    """
+    n = sample_count(params.fs, params.duration)
+    design = get_filter_design(
+        params.filter_type, params.order, params.cutoff, params.fs, structure="sos"
+    )
+    series = [scratch_array(n) for _ in range(5)]
+    t, signal_clean, noise, signal_input, signal_filtered = series
+    spectrograms = stream_spectrograms(params.fs, n, chunk_size)
+
+    start = 0
+    # Con fase cero se imita a filtfilt; la salida causal muestra el transitorio
+    chunks = generate_chunks(params, chunk_size)
+    for block in stream_filter(design.sos, chunks, steady_state=params.zero_phase):
+        stop = start + len(block[0])
+        for out, values in zip(series, block):
+            out[start:stop] = values
+        start = stop
+        spectrograms["signal_input"].update(block[3])
+        if not params.zero_phase:
+            spectrograms["signal_filtered"].update(block[4])
+
+    if params.zero_phase:
+        # La salida definitiva recién existe después de la pasada hacia atrás
+        zero_phase_pass(design.sos, signal_filtered, chunk_size)
+        _feed_in_chunks(spectrograms["signal_filtered"], signal_filtered, chunk_size)
+
+    freqs, spectrum_input, spectrum_filtered = spectra_from_spectrograms(spectrograms)
+
+    return SimulationResult(
+        t=t,
+        signal_clean=signal_clean,
+        noise=noise,
+        signal_input=signal_input,
+        signal_filtered=signal_filtered,
+        design=design,
+        freqs=freqs,
+        spectrum_input=spectrum_input,
+        spectrum_filtered=spectrum_filtered,
+        spectrograms=spectrograms,
+    )
@@ -0,0 +1,40 @@
+import numpy as np
+
+# Cantidad de intervalos por serie en los gráficos temporales; cada uno
+# aporta dos puntos (mínimo y máximo)
+DEFAULT_PLOT_BUCKETS = 1500
+
+
+def minmax_decimate(t, y, buckets=DEFAULT_PLOT_BUCKETS):
+    """Reduce (t, y) a como máximo 2*buckets puntos conservando los picos.
+
+    La señal se divide en intervalos consecutivos y de cada uno se conservan
+    la muestra mínima y la máxima, en orden temporal. Así el trazo tiene la
+    misma envolvente que la señal completa y el costo de dibujarlo no depende
+    de la cantidad de muestras.
+    """
+    n = len(y)
+    if n <= 2 * buckets:
+        return t, y
+
+    size = -(-n // buckets)  # muestras por intervalo (redondeo hacia arriba)
+    full = n // size
+    # Vista sin copia de los intervalos completos (también sobre un np.memmap);
+    # el último intervalo, más corto, se resuelve aparte
+    blocks = y[:full * size].reshape(full, size)
+
+    offsets = np.arange(full) * size
+    idx_min = offsets + blocks.argmin(axis=1)
+    idx_max = offsets + blocks.argmax(axis=1)
+    if full * size < n:
+        tail = y[full * size:]
+        idx_min = np.append(idx_min, full * size + tail.argmin())
+        idx_max = np.append(idx_max, full * size + tail.argmax())
+    rows = len(idx_min)
+
+    # Intercalar min y max respetando el orden en el tiempo
+    idx = np.empty(2 * rows, dtype=np.intp)
+    idx[0::2] = np.minimum(idx_min, idx_max)
+    idx[1::2] = np.maximum(idx_min, idx_max)
+
+    return t[idx], y[idx]
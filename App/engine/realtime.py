@@ -0,0 +1,95 @@
+import numpy as np
+
+from .filters import get_filter_design
+from .streaming import generate_chunks, sample_count, stream_filter
+
+
+class RingBuffer:
+    """Buffer circular de tamaño fijo sobre un único arreglo de NumPy.
+
+    Con `shape` cada elemento es a su vez un arreglo (p. ej. una columna
+    de un espectrograma); el buffer circula sobre el primer eje.
+    """
+
+    def __init__(self, capacity, dtype=float, shape=()):
+        self.data = np.zeros((capacity, *shape), dtype=dtype)
+        self.capacity = capacity
+        self.index = 0  # próxima posición a escribir
+        self.count = 0
+
+    def extend(self, values):
+        n = len(values)
+        if n >= self.capacity:
+            self.data[:] = values[-self.capacity:]
+            self.index = 0
+            self.count = self.capacity
+            return
+
+        end = self.index + n
+        if end <= self.capacity:
+            self.data[self.index:end] = values
+        else:
+            split = self.capacity - self.index
+            self.data[self.index:] = values[:split]
+            self.data[:n - split] = values[split:]
+        self.index = end % self.capacity
+        self.count = min(self.count + n, self.capacity)
+
+    def ordered(self, out=None):
+        """Contenido del más viejo al más nuevo, escrito en `out` si se pasa."""
+        if out is None:
+            out = np.empty_like(self.data)
+        if self.count < self.capacity:
+            out[:self.count] = self.data[:self.count]
+            return out[:self.count]
+        split = self.capacity - self.index
+        out[:split] = self.data[self.index:]
+        out[split:] = self.data[:self.index]
+        return out
+
+
+class RealtimeSimulation:
+    """Simulación sin fin: genera bloques, los filtra de forma causal y guarda
+    los últimos `window` segundos en buffers circulares.
+
+    A diferencia de filtfilt, el filtrado es causal (sosfilt con el estado zi
+    persistente), así que se ven el desfase y los transitorios reales. Cada
+    paso reutiliza los mismos arreglos: la memoria y el costo por cuadro no
+    dependen de cuánto tiempo lleve corriendo.
+    """
+
+    SERIES = ("t", "signal_clean", "signal_input", "signal_filtered")
+
+    def __init__(self, params, block_size, window=2.0, spectrograms=None):
+        self.params = params
+        self.block_size = block_size
+        self.design = get_filter_design(
+            params.filter_type, params.order, params.cutoff, params.fs, structure="sos"
+        )
+        self._stream = stream_filter(self.design.sos, generate_chunks(params, block_size, endless=True))
+
+        capacity = sample_count(params.fs, window)
+        self.buffers = {name: RingBuffer(capacity) for name in self.SERIES}
+        self._views = {name: np.empty(capacity) for name in self.SERIES}
+        # Serie -> IncrementalSpectrogram que recibe cada bloque nuevo (opcional)
+        self.spectrograms = spectrograms or {}
+
+    def step(self, blocks=1):
+        for _ in range(blocks):
+            t, signal_clean, _, signal_input, signal_filtered = next(self._stream)
+            self.buffers["t"].extend(t)
+            self.buffers["signal_clean"].extend(signal_clean)
+            self.buffers["signal_input"].extend(signal_input)
+            self.buffers["signal_filtered"].extend(signal_filtered)
+            block = {"signal_input": signal_input, "signal_filtered": signal_filtered}
+            for name, spectrogram in self.spectrograms.items():
+                spectrogram.update(block[name])
+
+    @property
+    def elapsed(self):
+        t = self.buffers["t"]
+        return t.data[t.index - 1] if t.count else 0.0
+
+    def window(self):
+        # Vistas ordenadas de la ventana visible (arreglos preasignados)
+        return {name: self.buffers[name].ordered(self._views[name]) for name in self.SERIES}
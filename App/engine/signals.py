@@ -0,0 +1,79 @@
+import numpy as np
+from scipy import signal
+
+from .noisebank import NoiseBank
+
+# Semiancho (Hz) de la banda del "Ruido banda estrecha"
+NARROWBAND_HALF_WIDTH = 5.0
+
+# Banco de ruido compartido por todas las sesiones del proceso
+NOISE_BANK = NoiseBank()
+
+
+def time_vector(fs, duration=1.0):
+    # `duration` segundos de señal muestreados a fs
+    return np.arange(int(round(fs * duration))) / fs
+
+
+def band_limited_noise(min_freq, max_freq, samples, sample_rate, rng=None):
+    # Se arma solo la mitad positiva del espectro: irfft completa la simetría
+    freqs = np.fft.rfftfreq(samples, 1/sample_rate)
+    spectrum = np.zeros(len(freqs), dtype=complex)
+
+    # Activar solo las componentes entre min y max freq
+    rng = rng or np.random.default_rng()
+    mask = (freqs >= min_freq) & (freqs <= max_freq)
+    count = np.count_nonzero(mask)
+    spectrum[mask] = rng.standard_normal(count) + 1j * rng.standard_normal(count)
+
+    # Convertir a dominio del tiempo
+    noise = np.fft.irfft(spectrum, samples)
+    noise = noise / np.max(np.abs(noise))  # normalizar
+
+    return noise
+
+
+def unit_noise(noise_type, freq, samples, fs, rng):
+    # Ruido de amplitud unitaria; la amplitud se aplica aparte
+    if noise_type == "Seno con fase aleatoria":
+        phi = rng.uniform(0, 2*np.pi)  # fase aleatoria
+        return np.sin(2 * np.pi * freq * np.arange(samples) / fs + phi)
+    elif noise_type == "Ruido banda estrecha":
+        # ruido centrado en freq ±5Hz
+        return band_limited_noise(freq - NARROWBAND_HALF_WIDTH, freq + NARROWBAND_HALF_WIDTH, samples, fs, rng)
+    elif noise_type == "Blanco":
+        return rng.standard_normal(samples)
+    raise ValueError(f"Tipo de ruido desconocido: {noise_type}")
+
+
+def noise_key(noise_type, freq, samples, fs, seed):
+    # El ruido blanco no depende de freq: cambiarla no debe regenerarlo
+    if noise_type == "Blanco":
+        freq = None
+    return noise_type, freq, samples, fs, seed
+
+
+def generate_noise(noise_type, amplitude, freq, t, fs, seed=None, bank=NOISE_BANK):
+    """Ruido de `amplitude` sobre el eje t (muestreado a fs).
+
+    Con una semilla el vector unitario sale del banco de ruido y se genera
+    una sola vez por (tipo, banda, fs, largo, semilla). Sin semilla se genera
+    uno nuevo en cada llamada.
+    """
+    samples = len(t)
+    if seed is None or bank is None:
+        return amplitude * unit_noise(noise_type, freq, samples, fs, np.random.default_rng(seed))
+
+    key = noise_key(noise_type, freq, samples, fs, seed)
+    noise = bank.get(key, lambda: unit_noise(noise_type, freq, samples, fs, np.random.default_rng(seed)))
+    return amplitude * noise
+
+
+def generate_waveform(waveform_type, amplitude, freq, t):
+    if waveform_type == "Sinusoidal":
+        return amplitude * np.sin(2 * np.pi * freq * t)
+    elif waveform_type == "Cuadrada":
+        return amplitude * signal.square(2 * np.pi * freq * t)
+    elif waveform_type == "Diente de sierra":
+        return amplitude * signal.sawtooth(2 * np.pi * freq * t)
+    raise ValueError(f"Tipo de señal desconocido: {waveform_type}")
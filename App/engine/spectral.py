@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import signal
+
+from .realtime import RingBuffer
+from .spectrum import DISPLAY_MAX_FREQ, band_slice
+
+SPECTRAL_WINDOWS = ["hann", "hamming", "blackman"]
+
+# Muestras que se transforman juntas (en segmentos enteros): acota la
+# memoria en señales largas o mapeadas desde disco, cualquiera sea nperseg
+SEGMENT_BATCH_SAMPLES = 2**20
+
+
+@dataclass(frozen=True)
+class SegmentPlan:
+    # Todo lo que depende solo de (nperseg, noverlap, fs, ventana): la
+    # ventana, el paso entre segmentos, los bins de la banda visible y el
+    # factor que lleva |X|² a densidad espectral unilateral (V²/Hz)
+    nperseg: int
+    noverlap: int
+    fs: float
+    window: np.ndarray
+    step: int
+    band: slice
+    freqs: np.ndarray
+    weights: np.ndarray
+
+
+@lru_cache(maxsize=64)
+def segment_plan(nperseg, noverlap, fs, window="hann", max_freq=DISPLAY_MAX_FREQ):
+    """Plan de segmentación memoizado (como scipy.signal.welch, detrend constante)."""
+    if not 0 <= noverlap < nperseg:
+        raise ValueError(f"Solapamiento inválido: {noverlap} de {nperseg} muestras")
+    win = signal.get_window(window, nperseg)
+    band = band_slice(nperseg, fs, max_freq)
+    freqs = np.fft.rfftfreq(nperseg, 1 / fs)[band]
+    # Unilateral: todos los bins cuentan doble salvo DC (fuera de la banda) y Nyquist
+    weights = np.full(len(freqs), 2 / (fs * np.sum(win**2)))
+    if nperseg % 2 == 0 and band.stop == nperseg // 2 + 1:
+        weights[-1] /= 2
+    for arr in (win, freqs, weights):
+        arr.flags.writeable = False
+    return SegmentPlan(nperseg, noverlap, fs, win, nperseg - noverlap, band, freqs, weights)
+
+
+def nperseg_for(fs, resolution, n=None):
+    # Potencia de 2 que da (al menos) la resolución pedida, sin superar la señal
+    nperseg = 1 << int(np.ceil(np.log2(fs / resolution)))
+    return min(nperseg, n) if n else nperseg
+
+
+def segment_count(n, plan):
+    return 0 if n < plan.nperseg else (n - plan.nperseg) // plan.step + 1
+
+
+def segment_power(x, plan, out=None):
+    """Densidad espectral de cada segmento completo de x: forma (segmentos, bins).
+
+    Con `out` (al menos segmentos × bins) el resultado se escribe ahí.
+    """
+    count = segment_count(len(x), plan)
+    out = np.empty((count, len(plan.freqs))) if out is None else out[:count]
+    if count == 0:
+        return out
+    segments = sliding_window_view(x, plan.nperseg)[::plan.step]
+    batch_size = max(1, SEGMENT_BATCH_SAMPLES // plan.nperseg)
+    for start in range(0, count, batch_size):
+        batch = segments[start:start + batch_size]
+        batch = (batch - batch.mean(axis=1, keepdims=True)) * plan.window
+        spectrum = np.fft.rfft(batch, axis=1)[:, plan.band]
+        out[start:start + len(batch)] = (spectrum.real**2 + spectrum.imag**2) * plan.weights
+    return out
+
+
+def segment_times(first, count, plan):
+    # Centro (s) de cada segmento; `first` es la muestra donde empieza el primero
+    return (first + np.arange(count) * plan.step + plan.nperseg / 2) / plan.fs
+
+
+def welch_psd(x, plan):
+    """PSD de Welch en la banda visible (promedio de segment_power)."""
+    return segment_power(x, plan).mean(axis=0)
+
+
+def spectrogram(x, plan):
+    """STFT de potencia: (tiempos, densidad por segmento) en la banda visible."""
+    power = segment_power(x, plan)
+    return segment_times(0, len(power), plan), power
+
+
+class IncrementalSpectrogram:
+    """Espectrograma que crece con la señal: cada update() solo transforma los
+    segmentos que se completan con las muestras nuevas.
+
+    Guarda las últimas `max_frames` columnas en un buffer circular y la suma
+    de todas las calculadas (para la PSD de Welch de toda la señal). Las
+    muestras que todavía no alcanzan para un segmento esperan en un buffer de
+    un segmento más `block_size` muestras; todos los arreglos se reservan al
+    crear el objeto y se reutilizan en cada actualización.
+    """
+
+    def __init__(self, plan, max_frames, block_size=None):
+        self.plan = plan
+        bins = len(plan.freqs)
+        self.frames = RingBuffer(max_frames, shape=(bins,))
+        self.times = RingBuffer(max_frames)
+        self.segments = 0
+
+        self._buffer = np.empty(plan.nperseg + (block_size or plan.nperseg))
+        self._fill = 0
+        self._first = 0  # muestra absoluta donde empieza _buffer
+
+        # Espacio de trabajo para los segmentos que completa un buffer lleno
+        batch = segment_count(len(self._buffer), plan)
+        self._power = np.empty((batch, bins))
+        self._times = np.empty(batch)
+        self._offsets = np.arange(batch) * plan.step + plan.nperseg / 2
+        self._power_sum = np.zeros(bins)
+        self._batch_sum = np.empty(bins)
+
+        # Salidas de window() y psd(): se sobrescriben en cada llamada
+        self._frames_view = np.empty_like(self.frames.data)
+        self._times_view = np.empty_like(self.times.data)
+        self._psd = np.zeros(bins)
+
+    def update(self, x):
+        count = 0
+        while len(x):
+            take = min(len(x), len(self._buffer) - self._fill)
+            self._buffer[self._fill:self._fill + take] = x[:take]
+            self._fill += take
+            x = x[take:]
+            count += self._drain()
+        return count
+
+    def _drain(self):
+        # Transforma los segmentos completos y corre el resto al principio
+        plan = self.plan
+        count = segment_count(self._fill, plan)
+        if count == 0:
+            return 0
+        used = (count - 1) * plan.step + plan.nperseg
+        power = segment_power(self._buffer[:used], plan, out=self._power)
+        times = np.add(self._offsets[:count], self._first, out=self._times[:count])
+        times /= plan.fs
+        self.frames.extend(power)
+        self.times.extend(times)
+        self._power_sum += power.sum(axis=0, out=self._batch_sum)
+        self.segments += count
+
+        consumed = count * plan.step
+        remaining = self._fill - consumed
+        self._buffer[:remaining] = self._buffer[consumed:self._fill]
+        self._fill = remaining
+        self._first += consumed
+        return count
+
+    def window(self):
+        # (tiempos, potencia) de las columnas guardadas, de la más vieja a la
+        # más nueva; son vistas que la próxima llamada sobrescribe
+        return self.times.ordered(self._times_view), self.frames.ordered(self._frames_view)
+
+    def psd(self):
+        # Welch sobre todos los segmentos calculados (también los descartados)
+        if self.segments:
+            np.divide(self._power_sum, self.segments, out=self._psd)
+        return self._psd
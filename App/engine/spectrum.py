@@ -0,0 +1,29 @@
+import numpy as np
+
+# Banda de frecuencias que muestran los gráficos espectrales
+DISPLAY_MAX_FREQ = 100.0
+
+
+def band_slice(n, fs, max_freq=DISPLAY_MAX_FREQ):
+    # Índices del eje de rfftfreq entre 0 (excluido) y max_freq (incluido).
+    # El eje es creciente, así que alcanza con un slice en vez de una máscara.
+    stop = int(np.floor(max_freq * n / fs)) + 1
+    return slice(1, min(stop, n // 2 + 1))
+
+
+def magnitude_spectrum(x, fs, max_freq=DISPLAY_MAX_FREQ):
+    """|rfft(x)| limitado a la banda visible, junto con su eje de frecuencias."""
+    band = band_slice(len(x), fs, max_freq)
+    freqs = np.fft.rfftfreq(len(x), 1/fs)[band]
+    return freqs, np.abs(np.fft.rfft(x)[band])
+
+
+def compute_spectrum(signal_input, signal_filtered, fs, max_freq=DISPLAY_MAX_FREQ):
+    """Magnitud de la FFT real de entrada y salida dentro de la banda visible.
+
+    Devuelve (freqs, magnitud_entrada, magnitud_filtrada). Se calcula una sola
+    FFT por señal y los mismos arreglos alimentan todos los gráficos.
+    """
+    freqs, fft_input_band = magnitude_spectrum(signal_input, fs, max_freq)
+    _, fft_filtered_band = magnitude_spectrum(signal_filtered, fs, max_freq)
+    return freqs, fft_input_band, fft_filtered_band
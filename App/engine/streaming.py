@@ -0,0 +1,133 @@
+import itertools
+
+import numpy as np
+from scipy import signal
+
+from .signals import NARROWBAND_HALF_WIDTH, generate_waveform
+
+# Tamaño de bloque por defecto para el procesamiento por partes
+DEFAULT_CHUNK_SIZE = 65536
+
+# Muestras por serie que admite una simulación completa en memoria: las
+# páginas guardan varias series de este largo (~32 MB cada una). Más allá hay
+# que recorrer generate_chunks/stream_filter sin acumular la señal.
+MAX_IN_MEMORY_SAMPLES = 2**22
+
+# Factor de cresta aproximado del ruido gaussiano: lleva el ruido de banda
+# estrecha generado por bloques a picos cercanos a 1, como band_limited_noise
+GAUSSIAN_CREST_FACTOR = 3.5
+
+
+def sample_count(fs, duration):
+    return int(round(fs * duration))
+
+
+def check_in_memory(fs, duration):
+    # Rechaza simulaciones que no caben completas en memoria
+    n = sample_count(fs, duration)
+    if n > MAX_IN_MEMORY_SAMPLES:
+        raise ValueError(
+            f"{n} muestras superan el máximo en memoria ({MAX_IN_MEMORY_SAMPLES}); "
+            "para señales más largas usar generate_chunks/stream_filter"
+        )
+    return n
+
+
+def iter_chunks(n, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Pares (inicio, fin) que recorren n muestras en bloques de chunk_size;
+    # con n=None la secuencia no termina
+    if n is None:
+        for start in itertools.count(0, chunk_size):
+            yield start, start + chunk_size
+        return
+    for start in range(0, n, chunk_size):
+        yield start, min(start + chunk_size, n)
+
+
+def narrowband_sos(freq, fs):
+    # Pasa-banda que da forma al ruido blanco en el modo por bloques
+    nyquist = fs / 2
+    low = max(freq - NARROWBAND_HALF_WIDTH, 0.5)
+    high = min(freq + NARROWBAND_HALF_WIDTH, 0.99 * nyquist)
+    return signal.butter(4, [low / nyquist, high / nyquist], btype='band', output='sos')
+
+
+def generate_chunks(params, chunk_size=DEFAULT_CHUNK_SIZE, endless=False):
+    """Genera la señal de entrada por bloques: (t, limpia, ruido, entrada).
+
+    El estado necesario para que los bloques sean continuos (fase aleatoria,
+    estado del filtro que da forma al ruido de banda estrecha) se mantiene
+    entre iteraciones, así que la memoria no depende de la duración. Con
+    `endless` se ignora params.duration y la generación no termina.
+    """
+    n = None if endless else sample_count(params.fs, params.duration)
+    rng = np.random.default_rng(params.seed)
+    phi = rng.uniform(0, 2*np.pi)  # fase aleatoria, una por corrida
+
+    if params.noise_type == "Ruido banda estrecha":
+        band_sos = narrowband_sos(params.freq_noise, params.fs)
+        band_zi = np.zeros((band_sos.shape[0], 2))
+        # La varianza del ruido blanco filtrado es ~ ancho_de_banda / Nyquist
+        band_scale = 1 / (GAUSSIAN_CREST_FACTOR * np.sqrt(4 * NARROWBAND_HALF_WIDTH / params.fs))
+
+    for start, stop in iter_chunks(n, chunk_size):
+        t = np.arange(start, stop) / params.fs
+        signal_clean = generate_waveform(params.waveform_type, params.amplitude_signal, params.freq_signal, t)
+
+        if params.noise_type == "Seno con fase aleatoria":
+            noise = params.amplitude_noise * np.sin(2 * np.pi * params.freq_noise * t + phi)
+        elif params.noise_type == "Ruido banda estrecha":
+            noise, band_zi = signal.sosfilt(band_sos, rng.standard_normal(len(t)), zi=band_zi)
+            noise *= params.amplitude_noise * band_scale
+        elif params.noise_type == "Blanco":
+            noise = params.amplitude_noise * rng.standard_normal(len(t))
+        else:
+            raise ValueError(f"Tipo de ruido desconocido: {params.noise_type}")
+
+        yield t, signal_clean, noise, signal_clean + noise
+
+
+def stream_filter(sos, chunks, steady_state=False):
+    """Filtra causalmente con sosfilt una secuencia de bloques de entrada.
+
+    `chunks` es un iterable de (t, limpia, ruido, entrada) como el de
+    generate_chunks; se devuelve cada bloque con la salida agregada. El
+    estado zi pasa de un bloque al siguiente. El filtro arranca en reposo,
+    con su transitorio de encendido; con `steady_state` arranca en régimen
+    para el primer valor de la entrada (como el relleno de filtfilt).
+    """
+    sos = np.array(sos)
+    zi = None
+    for t, signal_clean, noise, signal_input in chunks:
+        if zi is None:
+            zi = signal.sosfilt_zi(sos) * signal_input[0] if steady_state else np.zeros((len(sos), 2))
+        signal_filtered, zi = signal.sosfilt(sos, signal_input, zi=zi)
+        yield t, signal_clean, noise, signal_input, signal_filtered
+
+
+def zero_phase_pass(sos, y, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Pasada hacia atrás, en el lugar, sobre la salida de stream_filter.
+
+    Junto con la pasada causal equivale a un filtrado de fase cero (como
+    filtfilt, sin el relleno de bordes). `y` puede ser un np.memmap para que
+    señales largas no tengan que entrar completas en memoria.
+    """
+    sos = np.array(sos)
+    n = len(y)
+    zi = signal.sosfilt_zi(sos) * y[n - 1]
+    for start, stop in reversed(list(iter_chunks(n, chunk_size))):
+        block, zi = signal.sosfilt(sos, y[start:stop][::-1], zi=zi)
+        y[start:stop] = block[::-1]
+    return y
+
+
+def filter_in_chunks(sos, x, chunk_size=DEFAULT_CHUNK_SIZE, zero_phase=True):
+    """Filtra con sosfilt por bloques una señal que ya está en memoria."""
+    sos = np.array(sos)
+    y = np.empty_like(x)
+    zi = signal.sosfilt_zi(sos) * x[0]
+    for start, stop in iter_chunks(len(x), chunk_size):
+        y[start:stop], zi = signal.sosfilt(sos, x[start:stop], zi=zi)
+    if zero_phase:
+        zero_phase_pass(sos, y, chunk_size)
+    return y
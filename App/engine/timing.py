@@ -0,0 +1,168 @@
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Archivo de registro por defecto; se puede cambiar con SIMULADOR_TIMING_LOG
+DEFAULT_LOG_PATH = Path(__file__).resolve().parents[1] / "logs" / "timings.jsonl"
+DEFAULT_LOG_MAX_BYTES = 5 * 1024**2
+DEFAULT_LOG_BACKUPS = 3
+# Los registros se escriben juntos: cada tantos registros o segundos
+DEFAULT_LOG_FLUSH_RECORDS = 20
+DEFAULT_LOG_FLUSH_SECONDS = 10.0
+
+
+class RerunTimer:
+    """Tiempos por etapa de un rerun, acumulados si una etapa se repite."""
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    @property
+    def total(self):
+        return sum(self.stages.values())
+
+    def as_record(self, **context):
+        # Registro listo para serializar como una línea JSON
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            **context,
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "total": round(self.total, 6),
+        }
+
+
+class TimingLog:
+    """Registro JSONL con rotación por tamaño (timings.jsonl, .1, .2, ...).
+
+    append() acumula las líneas en memoria y las escribe de una vez cada
+    `flush_records` registros o `flush_seconds` segundos (y al salir), así
+    un rerun normalmente no toca el disco.
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_LOG_MAX_BYTES, backups=DEFAULT_LOG_BACKUPS,
+                 flush_records=DEFAULT_LOG_FLUSH_RECORDS, flush_seconds=DEFAULT_LOG_FLUSH_SECONDS):
+        self.path = Path(path or os.environ.get("SIMULADOR_TIMING_LOG", DEFAULT_LOG_PATH))
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_records = flush_records
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._pending = []
+        self._last_flush = time.monotonic()
+        # Registros ya leídos por archivo: ((inode, mtime, tamaño), registros, bytes leídos)
+        self._parsed = {}
+        atexit.register(self.flush)
+
+    def files(self):
+        # Archivos existentes, del más viejo al más nuevo
+        candidates = [self.path.with_name(f"{self.path.name}.{i}") for i in range(self.backups, 0, -1)]
+        return [p for p in candidates + [self.path] if p.exists()]
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                src.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+
+    def append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._pending.append(line)
+            if (len(self._pending) >= self.flush_records
+                    or time.monotonic() - self._last_flush >= self.flush_seconds):
+                self._write_pending()
+
+    def flush(self):
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self):
+        # Se llama con el lock tomado
+        lines = "".join(self._pending)
+        self._pending = []
+        self._last_flush = time.monotonic()
+        if not lines:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size + len(lines.encode("utf-8")) > self.max_bytes:
+                self._rotate()
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError:
+            # Medir nunca debe romper la página (p. ej. disco de solo lectura)
+            pass
+
+    def _read(self, path):
+        # Cada archivo se parsea una sola vez; si solo creció (mismo inode,
+        # p. ej. el activo después de un flush) se leen únicamente las líneas nuevas
+        stat = path.stat()
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        records, offset = [], 0
+        if cached is not None and cached[0][0] == stat.st_ino and cached[2] <= stat.st_size:
+            records, offset = cached[1], cached[2]
+        with path.open("rb") as f:
+            f.seek(offset)
+            data = f.read()
+        # Una línea a medio escribir queda para la próxima lectura
+        complete = data[:data.rfind(b"\n") + 1]
+        records.extend(json.loads(line) for line in complete.decode("utf-8").splitlines() if line.strip())
+        self._parsed[path] = (key, records, offset + len(complete))
+        return records
+
+    def records(self):
+        self.flush()
+        with self._lock:
+            files = self.files()
+            for path in set(self._parsed) - set(files):
+                del self._parsed[path]
+            records = []
+            for path in files:
+                records.extend(self._read(path))
+        return records
+
+
+def aggregate(records, page=None):
+    """p50/p95 (en segundos) y cantidad de muestras por etapa."""
+    # numpy se importa acá para que la página de inicio no lo cargue
+    import numpy as np
+
+    samples = {}
+    for record in records:
+        if page is not None and record.get("page") != page:
+            continue
+        for name, seconds in record["stages"].items():
+            samples.setdefault(name, []).append(seconds)
+        samples.setdefault("total", []).append(record["total"])
+
+    return {
+        name: {
+            "count": len(values),
+            "p50": float(np.percentile(values, 50)),
+            "p95": float(np.percentile(values, 95)),
+        }
+        for name, values in samples.items()
+    }
+
+
+TIMING_LOG = TimingLog()
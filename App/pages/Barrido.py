@@ -0,0 +1,115 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from engine import NOISE_TYPES, WAVEFORM_TYPES, SimulationParams, cutoff_grid, run_sweep
+from ui import back_button, seed_control
+
+# Configuración de la página
+st.set_page_config(
+    page_title="Barrido de Parámetros",
+    page_icon="📊",
+    layout="wide"
+)
+
+st.title("📊 Barrido de Parámetros", help="Simula muchas combinaciones de orden, corte y ruido en una sola corrida")
+st.markdown("### Compara qué orden y frecuencia de corte funcionan mejor")
+
+# Tipo de filtro
+st.sidebar.header("Filtro")
+filter_type = st.sidebar.selectbox("Tipo de filtro", ["Pasa-Bajo", "Pasa-Alto", "Pasa-Banda"])
+order_min, order_max = st.sidebar.slider("Orden del filtro", 1, 10, (1, 6))
+
+if filter_type == "Pasa-Banda":
+    low_min, low_max = st.sidebar.slider("Frecuencia inferior (Hz)", 1, 80, (5, 25))
+    high_min, high_max = st.sidebar.slider("Frecuencia superior (Hz)", 1, 100, (30, 60))
+    band_steps = st.sidebar.number_input("Puntos por extremo", 2, 15, 5)
+    cutoffs = cutoff_grid(
+        filter_type,
+        lows=np.linspace(low_min, low_max, band_steps),
+        highs=np.linspace(high_min, high_max, band_steps),
+    )
+else:
+    cutoff_min, cutoff_max = st.sidebar.slider("Frecuencia de corte (Hz)", 1.0, 100.0, (5.0, 60.0))
+    cutoff_steps = st.sidebar.number_input("Puntos de corte", 2, 50, 12)
+    cutoffs = cutoff_grid(filter_type, cutoffs=np.linspace(cutoff_min, cutoff_max, cutoff_steps))
+
+# Señal y ruido
+st.sidebar.header("Señal y Ruido")
+waveforms = st.sidebar.multiselect("Formas de señal", WAVEFORM_TYPES, default=["Sinusoidal"])
+noise_type = st.sidebar.selectbox("Tipo de ruido", NOISE_TYPES)
+freq_signal = st.sidebar.number_input("Frecuencia de la señal principal (Hz)", 1, 100, 10)
+freq_noise = st.sidebar.number_input("Frecuencia del ruido (Hz)", 20, 200, 50)
+amplitude_signal = st.sidebar.number_input("Amplitud de la señal (V)", 0.1, 5.0, 1.0, 0.1)
+noise_min, noise_max = st.sidebar.slider("Amplitud del ruido (V)", 0.05, 1.0, (0.1, 0.5))
+noise_steps = st.sidebar.number_input("Puntos de amplitud", 1, 10, 3)
+seed = seed_control()
+
+if not waveforms:
+    st.warning("Selecciona al menos una forma de señal")
+    st.stop()
+
+base = SimulationParams(
+    filter_type=filter_type,
+    order=order_min,
+    cutoff=cutoffs[0] if cutoffs else 0,
+    noise_type=noise_type,
+    amplitude_signal=amplitude_signal,
+    freq_signal=freq_signal,
+    freq_noise=freq_noise,
+    seed=seed,
+)
+table = run_sweep(
+    base,
+    orders=range(order_min, order_max + 1),
+    cutoffs=cutoffs,
+    noise_amplitudes=np.linspace(noise_min, noise_max, noise_steps),
+    waveforms=waveforms,
+)
+
+df = pd.DataFrame(table).rename(columns={
+    "waveform": "Señal",
+    "noise_amplitude": "Amplitud ruido (V)",
+    "order": "Orden",
+    "cutoff": "Corte (Hz)",
+    "low_freq": "F1 (Hz)",
+    "high_freq": "F2 (Hz)",
+    "snr_in_db": "SNR entrada (dB)",
+    "snr_out_db": "SNR salida (dB)",
+    "snr_improvement_db": "Mejora SNR (dB)",
+    "residual_rms": "Error residual (V rms)",
+    "attenuation_db": f"Atenuación en {freq_noise} Hz (dB)",
+})
+
+if df.empty:
+    st.warning("No hay combinaciones válidas: la frecuencia inferior debe ser menor que la superior")
+    st.stop()
+
+cutoff_columns = ["F1 (Hz)", "F2 (Hz)"] if filter_type == "Pasa-Banda" else ["Corte (Hz)"]
+
+# Mejor combinación
+best = df.loc[df["Mejora SNR (dB)"].idxmax()]
+col1, col2, col3 = st.columns(3)
+col1.metric("Combinaciones simuladas", len(df))
+col2.metric("Mejor orden", int(best["Orden"]))
+col3.metric("Mejor corte", " - ".join(f"{best[c]:.1f}" for c in cutoff_columns) + " Hz")
+
+# Mapa de la mejora promedio por orden y corte
+st.subheader("🗺️ Mejora de SNR promedio")
+if filter_type == "Pasa-Banda":
+    df["Banda (Hz)"] = df["F1 (Hz)"].map("{:.1f}".format) + "-" + df["F2 (Hz)"].map("{:.1f}".format)
+    x_column = "Banda (Hz)"
+else:
+    x_column = "Corte (Hz)"
+heatmap = df.pivot_table(index="Orden", columns=x_column, values="Mejora SNR (dB)", aggfunc="mean")
+fig = px.imshow(
+    heatmap, aspect="auto", origin="lower", color_continuous_scale="RdBu",
+    labels=dict(color="Mejora SNR (dB)"),
+)
+st.plotly_chart(fig, use_container_width=True)
+
+st.subheader("📋 Resultados")
+st.dataframe(df.sort_values("Mejora SNR (dB)", ascending=False), use_container_width=True, hide_index=True)
+
+back_button()
@@ -0,0 +1,14 @@
+# Componentes de interfaz compartidos por las páginas de filtros.
+from .controls import method_controls, multirate_controls, sampling_controls, seed_control, structure_control
+from .page import back_button, render_filter_info, render_results
+
+__all__ = [
+    "back_button",
+    "method_controls",
+    "multirate_controls",
+    "render_filter_info",
+    "render_results",
+    "sampling_controls",
+    "seed_control",
+    "structure_control",
+]
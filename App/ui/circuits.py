@@ -0,0 +1,89 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from engine import (
+    CIRCUITS,
+    bode_frequencies,
+    circuit_filter,
+    cutoff_frequencies,
+    nominal_components,
+    tf_bode,
+    tolerance_analysis,
+)
+
+from .plots import COLOR_FILTERED, COLOR_INPUT, cutoff_markers, plot_tolerance_band
+
+# Unidades en las que se cargan los componentes: (etiqueta, factor a SI)
+COMPONENT_UNITS = {
+    "R": ("R (Ω)", 1.0),
+    "L": ("L (mH)", 1e-3),
+    "C": ("C (µF)", 1e-6),
+}
+TOLERANCE_LABELS = {"R": "Tolerancia R (%)", "L": "Tolerancia L (%)", "C": "Tolerancia C (%)"}
+
+
+def _component_inputs(circuit, params):
+    # Los valores sugeridos dan el corte elegido en la barra lateral con R = 1 kΩ
+    nominal = nominal_components(circuit, params.cutoff)
+    values = {}
+    for col, name in zip(st.columns(len(circuit.components)), circuit.components):
+        label, scale = COMPONENT_UNITS[name]
+        value = col.number_input(
+            label, min_value=1e-6, value=float(f"{nominal[name] / scale:.4g}"), format="%.4g",
+            key=f"circuit_{circuit.name}_{name}_{params.cutoff}",
+        )
+        values[name] = value * scale
+    return values
+
+
+def render_circuit(params):
+    # Circuitos reales de la portada: corte nominal y dispersión por tolerancias
+    names = [name for name, c in CIRCUITS.items() if c.filter_type == params.filter_type]
+    with st.expander("🔌 Circuito con componentes reales"):
+        name = st.radio("Esquemático", names, format_func=lambda n: f"{n} · {CIRCUITS[n].label}",
+                        horizontal=True, key="circuit_name")
+        circuit = CIRCUITS[name]
+        values = _component_inputs(circuit, params)
+
+        cutoff = cutoff_frequencies(circuit, values)
+        if circuit.order == 1:
+            st.metric("Corte nominal", f"{cutoff:.2f} Hz")
+        else:
+            st.metric("Banda nominal", f"{cutoff[0]:.2f}-{cutoff[1]:.2f} Hz")
+
+        st.caption("Tolerancias (sorteo uniforme dentro de ±tolerancia)")
+        tolerances = {}
+        for col, component in zip(st.columns(len(circuit.components)), circuit.components):
+            default = 5 if component == "R" else 10
+            tolerances[component] = col.number_input(
+                TOLERANCE_LABELS[component], 0, 50, default, key=f"tol_{component}"
+            ) / 100
+        draws = st.number_input("Cantidad de sorteos", 100, 100000, 5000, 100, key="circuit_draws")
+        if not st.button("Analizar tolerancias", key="btn_tolerances"):
+            return
+
+        freqs = bode_frequencies(params.fs)
+        result = tolerance_analysis(circuit, values, params.fs, freqs, tolerances=tolerances, draws=draws)
+        # Respuesta digital del circuito con los valores cargados, sin tolerancias
+        nominal = tf_bode(*circuit_filter(circuit, values, params.fs), freqs, params.fs)
+        cutoffs, gains = result.percentiles()
+        edges = ["Corte"] if circuit.order == 1 else ["Borde inferior", "Borde superior"]
+        for i, (col, label) in enumerate(zip(st.columns(len(edges)), edges)):
+            low, mid, high = cutoffs if circuit.order == 1 else cutoffs[:, i]
+            col.metric(label, f"{mid:.2f} Hz")
+            col.caption(f"P5–P95: {low:.2f} – {high:.2f} Hz")
+
+        fig = go.Figure()
+        colors = [COLOR_INPUT, COLOR_FILTERED]
+        for i, label in enumerate(edges):
+            x = result.cutoffs if circuit.order == 1 else result.cutoffs[:, i]
+            fig.add_trace(go.Histogram(x=x, name=label, marker_color=colors[i], opacity=0.7))
+        fig.update_layout(
+            xaxis_title="Frecuencia de corte (Hz)", yaxis_title="Sorteos", barmode="overlay",
+            height=300, margin=dict(l=10, r=10, t=10, b=10),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(
+            plot_tolerance_band(result.freqs, gains, cutoff_markers(params), nominal=nominal.magnitude_db),
+            use_container_width=True,
+        )
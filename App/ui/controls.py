@@ -0,0 +1,102 @@
+import streamlit as st
+
+from engine import DESIGN_METHODS, FILTER_STRUCTURES, MAX_IN_MEMORY_SAMPLES
+
+STRUCTURE_LABELS = {
+    "auto": "Automática",
+    "ba": "Coeficientes (b, a)",
+    "sos": "Secciones de 2º orden (SOS)",
+    "fir": "FIR (convolución FFT)",
+}
+
+METHOD_LABELS = {
+    "iir": "IIR Butterworth",
+    "firwin": "FIR ventana de Kaiser (firwin)",
+    "remez": "FIR equirriple (remez)",
+}
+
+
+def structure_control():
+    return st.sidebar.selectbox(
+        "Estructura del filtro",
+        FILTER_STRUCTURES,
+        format_func=STRUCTURE_LABELS.get,
+        help="En modo automático se usan secciones de 2º orden para órdenes altos o bandas angostas, que son numéricamente más estables"
+    )
+
+
+def method_controls():
+    # Familia del filtro; los FIR se aplican por convolución FFT (overlap-add)
+    method = st.sidebar.selectbox(
+        "Diseño del filtro",
+        DESIGN_METHODS,
+        format_func=METHOD_LABELS.get,
+        help="Los FIR tienen fase lineal y se aplican con convolución FFT por bloques"
+    )
+    numtaps = None
+    if method != "iir":
+        numtaps = st.sidebar.number_input(
+            "Coeficientes FIR (0 = automático)", 0, 4095, 0, 2,
+            help="En automático se estiman para 60 dB de atenuación"
+        ) or None
+    return method, numtaps
+
+
+SAMPLE_RATES = [1000, 8000, 44100, 48000, 96000, 192000]
+
+# Por bloques la señal se escribe en disco: la duración no depende de fs
+STREAMING_MAX_DURATION = 600.0
+
+
+def sampling_controls():
+    # Frecuencia de muestreo, duración y modo de procesamiento
+    st.sidebar.header("Muestreo", help="Configura la frecuencia de muestreo y la duración de la simulación")
+    fs = st.sidebar.selectbox("Frecuencia de muestreo (Hz)", SAMPLE_RATES)
+    streaming = st.sidebar.checkbox(
+        "Procesar por bloques",
+        help="Genera y filtra la señal en bloques con sosfilt, arrastrando el estado entre bloques, "
+             "y la guarda en disco en lugar de en memoria"
+    )
+    if streaming:
+        duration = st.sidebar.number_input(
+            "Duración (s)", 0.1, STREAMING_MAX_DURATION, 1.0, 0.1,
+            help="Con FIR o multitasa la señal se filtra en memoria y rige el límite del modo normal"
+        )
+    else:
+        # La señal completa se guarda en memoria: la duración máxima depende de fs
+        max_duration = float(int(10 * MAX_IN_MEMORY_SAMPLES / fs) / 10)
+        duration = st.sidebar.number_input(
+            "Duración (s)", 0.1, max_duration, 1.0, 0.1,
+            help=f"Hasta {MAX_IN_MEMORY_SAMPLES / 1e6:.1f} millones de muestras ({max_duration:g} s a {fs} Hz)"
+        )
+    zero_phase = True
+    if streaming:
+        zero_phase = st.sidebar.checkbox(
+            "Fase cero",
+            value=True,
+            help="Agrega una pasada hacia atrás para eliminar el desfase, como filtfilt"
+        )
+    return fs, duration, streaming, zero_phase
+
+
+def multirate_controls():
+    # Diezmado polifásico a la banda que se muestra antes de filtrar
+    multirate = st.sidebar.checkbox(
+        "Multitasa (diezmar a la banda de interés)",
+        help="Diezma con resample_poly a la menor tasa que cubre la banda mostrada, el corte y el ruido senoidal "
+             "o de banda estrecha, y diseña el filtro a esa tasa. El ruido blanco por encima de esa banda se elimina al diezmar"
+    )
+    upsample = False
+    if multirate:
+        upsample = st.sidebar.checkbox(
+            "Volver a la tasa original",
+            help="Interpola la salida filtrada a la frecuencia de muestreo original"
+        )
+    return multirate, upsample
+
+
+def seed_control():
+    return st.sidebar.number_input(
+        "Semilla del ruido", 0, 2**31 - 1, 0,
+        help="Con la misma semilla el ruido se repite, así los cambios en el filtro se comparan sobre la misma señal"
+    )
@@ -0,0 +1,277 @@
+from functools import partial
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from engine import (
+    EXPORT_FORMATS,
+    NOISE_BANK,
+    RerunTimer,
+    FIR_MAX_TAPS,
+    MAX_IN_MEMORY_SAMPLES,
+    Stage,
+    analysis_rate,
+    compare_fir_iir,
+    design_cache_info,
+    export_bytes,
+    get_bode_response,
+    make_simulation_graph,
+    make_streaming_graph,
+    result_from_values,
+    run_monte_carlo,
+    sample_count,
+    streams_in_blocks,
+    summarize,
+)
+
+from .circuits import render_circuit
+from .controls import METHOD_LABELS, STRUCTURE_LABELS
+from .plots import cutoff_markers, plot_bode, plot_spectra, plot_time_signals
+from .realtime import render_realtime
+from .spectral import render_spectral
+from .timing import finish_rerun
+
+EXPLANATIONS = {
+    "Pasa-Bajo": """
+    **Filtro Pasa-Bajo**: Permite el paso de frecuencias por debajo de la frecuencia de corte 
+    y atenúa las frecuencias superiores. Útil para eliminar ruido de alta frecuencia.
+    """,
+    "Pasa-Alto": """
+    **Filtro Pasa-Alto**: Permite el paso de frecuencias por encima de la frecuencia de corte 
+    y atenúa las frecuencias inferiores. Útil para eliminar componentes de baja frecuencia como DC offset.
+    """,
+    "Pasa-Banda": """
+    **Filtro Pasa-Banda**: Permite el paso de frecuencias dentro de un rango específico 
+    y atenúa tanto las frecuencias más bajas como las más altas. Útil para seleccionar una banda específica.
+    """,
+}
+
+
+def _plot_time_stage(params, output):
+    t, signal_clean, _, signal_input, signal_filtered, _ = output
+    return plot_time_signals(t, signal_input, signal_clean, signal_filtered, params.filter_type)
+
+
+def _plot_spectra_stage(params, spectra):
+    return plot_spectra(*spectra, cutoff_markers(params))
+
+
+def _plot_bode_stage(params, design):
+    # Solo la banda visible, en escala logarítmica; memoizado por diseño
+    bode = get_bode_response(
+        params.filter_type, params.order, params.cutoff, analysis_rate(params),
+        structure=design.structure, method=params.method, numtaps=len(design.b) if design.structure == "fir" else None,
+    )
+    return plot_bode(bode, cutoff_markers(params))
+
+
+# Etapas de gráficos que se suman al grafo de la simulación
+PLOT_STAGES = [
+    Stage("plot_time", _plot_time_stage, fields=("filter_type",), deps=("output",)),
+    Stage("plot_spectra", _plot_spectra_stage, fields=("filter_type", "cutoff"), deps=("spectra",)),
+    Stage("plot_bode", _plot_bode_stage, fields=("filter_type", "order", "cutoff", "fs", "multirate"), deps=("design",)),
+]
+
+
+# Muestras por serie por encima de las cuales el grafo no se guarda en la
+# sesión: cada sesión retendría una decena de series completas entre reruns
+SESSION_MEMO_MAX_SAMPLES = 2**20
+
+
+def run_page_pipeline(params):
+    # Un grafo por sesión, por página y por modo: cada rerun solo recalcula lo que cambió
+    blocks = streams_in_blocks(params)
+    make_graph = make_streaming_graph if blocks else make_simulation_graph
+    key = f"pipeline_{params.filter_type}_{'blocks' if blocks else 'memory'}"
+    if sample_count(params.fs, params.duration) > SESSION_MEMO_MAX_SAMPLES:
+        # Señal larga: se calcula todo y las salidas se liberan al terminar el rerun
+        st.session_state.pop(key, None)
+        return make_graph(PLOT_STAGES).run(params)
+    if key not in st.session_state:
+        st.session_state[key] = make_graph(PLOT_STAGES)
+    return st.session_state[key].run(params)
+
+
+def render_results(params):
+    if not streams_in_blocks(params) and sample_count(params.fs, params.duration) > MAX_IN_MEMORY_SAMPLES:
+        st.error(f"Con FIR o multitasa la señal se filtra en memoria: hasta "
+                 f"{MAX_IN_MEMORY_SAMPLES / params.fs:.1f} s a {params.fs} Hz. Reducí la duración.")
+        return
+
+    timer = RerunTimer()
+    values, runs = run_page_pipeline(params)
+    for run in runs:
+        if run.ran:
+            timer.record(run.name, run.seconds)
+
+    with timer.stage("st.plotly_chart"):
+        # Layout en columnas
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("📈 Señales en el Tiempo")
+            st.plotly_chart(values["plot_time"], use_container_width=True)
+
+        with col2:
+            st.subheader("📊 Análisis Frecuencial")
+            st.plotly_chart(values["plot_spectra"], use_container_width=True)
+            if params.streaming:
+                st.caption("Por bloques: raíz de la PSD de Welch (V/√Hz) acumulada segmento a segmento.")
+
+        st.subheader("🎚️ Diagrama de Bode")
+        st.plotly_chart(values["plot_bode"], use_container_width=True)
+        if values["design"].structure != "fir" and (params.zero_phase or not params.streaming):
+            st.caption("Respuesta de una pasada del filtro. Con filtrado de fase cero (ida y vuelta) "
+                       "la magnitud en dB se duplica y la fase y el retardo se anulan.")
+
+    render_spectral(params, values)
+    render_filter_info(params, values["design"])
+    render_fir_comparison(params, values)
+    render_circuit(params)
+    render_export(params, values)
+    render_realtime(params)
+    render_monte_carlo(params)
+    render_cache_stats()
+    finish_rerun(timer, params.filter_type, reused=[run.name for run in runs if not run.ran])
+
+
+def render_filter_info(params, design):
+    # Información adicional
+    st.subheader("📋 Información del Filtro")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.metric("Tipo de Filtro", params.filter_type)
+        if design.structure == "fir":
+            st.metric("Coeficientes FIR", len(design.b))
+        else:
+            st.metric("Orden del Filtro", params.order)
+        st.metric("Estructura", STRUCTURE_LABELS[design.structure])
+
+    with col2:
+        if params.filter_type == "Pasa-Banda":
+            low_freq, high_freq = params.cutoff
+            st.metric("Banda de Paso", f"{low_freq}-{high_freq} Hz")
+        else:
+            st.metric("Frecuencia de Corte", f"{params.cutoff:.2f} Hz")
+        st.metric("Frecuencia de Muestreo", f"{params.fs} Hz")
+        if params.multirate:
+            st.metric("Frecuencia de Análisis", f"{analysis_rate(params):.1f} Hz",
+                      help="Tasa reducida a la que se diseña y aplica el filtro")
+        st.metric("Duración", f"{params.duration:g} s")
+
+    if design.method is not None and design.method != params.method:
+        st.warning(f"{METHOD_LABELS[params.method]} no convergió para este corte: "
+                   f"se usó {METHOD_LABELS[design.method]}.")
+    if design.structure == "fir" and len(design.b) >= FIR_MAX_TAPS:
+        st.warning("Se alcanzó el máximo de coeficientes FIR: la transición es más ancha que la pedida.")
+
+    # Explicación del filtro
+    st.subheader("💡 Explicación")
+    st.info(EXPLANATIONS[params.filter_type])
+
+
+def render_fir_comparison(params, values):
+    # Misma entrada por el IIR de la página y por un FIR, con tiempos
+    with st.expander("⚖️ Comparación FIR vs IIR"):
+        if "signal" not in values:
+            st.caption("No disponible en modo por bloques: la comparación filtra la señal completa en memoria.")
+            return
+        method = params.method if params.method != "iir" else "firwin"
+        st.caption(f"IIR de orden {params.order} frente a un FIR {METHOD_LABELS[method]} sobre la misma señal.")
+        if not st.button("Comparar", key="btn_fir_iir"):
+            return
+        rows = compare_fir_iir(params, values["signal"], values["sum"], method, params.numtaps)
+        for col, row in zip(st.columns(len(rows)), rows):
+            col.metric(row["variant"], f"{row['seconds'] * 1000:.2f} ms")
+            col.caption(f"{row['size']} · SNR salida {row['snr_out_db']:.1f} dB")
+
+
+EXPORT_MIMES = {
+    "npz": "application/octet-stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def render_export(params, values):
+    # El archivo se arma recién al hacer clic (descarga diferida)
+    with st.expander("💾 Exportar resultados"):
+        if sample_count(params.fs, params.duration) > MAX_IN_MEMORY_SAMPLES:
+            st.caption(f"El archivo se arma en memoria: disponible hasta {MAX_IN_MEMORY_SAMPLES / 1e6:.1f} "
+                       "millones de muestras.")
+            return
+        fmt = st.radio("Formato", EXPORT_FORMATS, horizontal=True, key="export_format")
+        st.caption("Incluye señales, espectros, coeficientes del filtro y parámetros.")
+        compressed = fmt == "npz" and st.checkbox(
+            "Comprimir", key="export_compressed",
+            help="Archivo más chico, pero load_run ya no puede mapearlo en memoria y lo lee entero"
+        )
+        result = result_from_values(values)
+        st.download_button(
+            "Descargar",
+            data=partial(export_bytes, result, params, fmt, compressed),
+            file_name=f"simulacion_{params.btype}.{fmt}",
+            mime=EXPORT_MIMES[fmt],
+            on_click="ignore",
+            key="btn_export",
+        )
+
+
+def render_monte_carlo(params):
+    # Repite el escenario con distintas semillas en el pool de procesos
+    with st.expander("🎲 Análisis Monte-Carlo"):
+        col1, col2 = st.columns(2)
+        n_runs = col1.number_input("Cantidad de realizaciones", 10, 10000, 200, 10)
+        base_seed = col2.number_input("Semilla inicial", 0, 2**31 - 1, 0)
+        if not st.button("Ejecutar", key="btn_monte_carlo"):
+            return
+
+        progress = st.progress(0.0, text="Simulando...")
+        realisations = []
+        for realisation in run_monte_carlo(params, n_runs, base_seed):
+            realisations.append(realisation)
+            progress.progress(len(realisations) / n_runs, text=f"{len(realisations)}/{n_runs} realizaciones")
+        progress.empty()
+
+        summary = summarize(realisations)
+        labels = {
+            "snr_in_db": "SNR entrada",
+            "snr_out_db": "SNR salida",
+            "snr_improvement_db": "Mejora SNR",
+        }
+        for col, (key, label) in zip(st.columns(3), labels.items()):
+            mean, low, high = summary[key]
+            col.metric(label, f"{mean:.2f} dB")
+            col.caption(f"IC 95%: {low:.2f} – {high:.2f} dB")
+
+        fig = go.Figure(go.Histogram(x=[r.snr_out_db for r in realisations], marker_color='red'))
+        fig.update_layout(
+            xaxis_title="SNR de salida (dB)", yaxis_title="Realizaciones",
+            height=300, margin=dict(l=10, r=10, t=10, b=10),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def render_cache_stats():
+    # Estadísticas de las cachés compartidas por todas las sesiones
+    info = design_cache_info()
+    with st.sidebar.expander("Caché de diseños"):
+        st.write(f"Aciertos: {info.hits}")
+        st.write(f"Fallos: {info.misses}")
+        st.write(f"Diseños guardados: {info.currsize}/{info.maxsize}")
+
+    bank = NOISE_BANK.info()
+    with st.sidebar.expander("Banco de ruido"):
+        st.write(f"Aciertos: {bank.hits}")
+        st.write(f"Fallos: {bank.misses}")
+        st.write(f"Vectores guardados: {bank.entries} ({bank.nbytes / 1024**2:.1f}/{bank.max_bytes / 1024**2:.0f} MB)")
+
+
+def back_button():
+    if st.button(
+        label="volver",
+        key="btn_volver_opcion1"
+    ):
+        if "page_to_go" in st.session_state:
+            del st.session_state.page_to_go
+        st.switch_page("app.py")
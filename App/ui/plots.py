@@ -0,0 +1,163 @@
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from engine import DISPLAY_MAX_FREQ, minmax_decimate
+
+# Colores de las series en todos los gráficos
+COLOR_INPUT = 'blue'
+COLOR_CLEAN = 'green'
+COLOR_FILTERED = 'red'
+
+
+def cutoff_markers(params):
+    # (frecuencia, etiqueta) de las líneas que marcan la(s) frecuencia(s) de corte
+    if params.filter_type == "Pasa-Banda":
+        low_freq, high_freq = params.cutoff
+        return [(low_freq, f'F1 = {low_freq:.2f} Hz'), (high_freq, f'F2 = {high_freq:.2f} Hz')]
+    return [(params.cutoff, f"Fc: {params.cutoff:.2f} Hz")]
+
+
+def _line(x, y, name, color, width=1.5, dash=None, opacity=1.0, showlegend=True):
+    return go.Scatter(
+        x=x, y=y, mode='lines', name=name, legendgroup=name, showlegend=showlegend,
+        line=dict(color=color, width=width, dash=dash), opacity=opacity,
+    )
+
+
+def _add_markers(fig, markers, **kwargs):
+    for freq, label in markers:
+        fig.add_vline(
+            x=freq, line=dict(color='red', dash='dash'), opacity=0.7,
+            annotation_text=label, annotation_position="top right", **kwargs
+        )
+
+
+def plot_time_signals(t, signal_input, signal_clean, signal_filtered, filter_type):
+    # Toda la señal, reducida a unos pocos miles de puntos sin perder picos
+    t_input, signal_input = minmax_decimate(t, signal_input)
+    t_clean, signal_clean = minmax_decimate(t, signal_clean)
+    t_filtered, signal_filtered = minmax_decimate(t, signal_filtered)
+
+    fig = make_subplots(
+        rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.08,
+        subplot_titles=('Señal de Entrada', f'Señal Filtrada - {filter_type}', 'Comparación'),
+    )
+
+    # Señal original
+    fig.add_trace(_line(t_input, signal_input, 'Señal + Ruido', COLOR_INPUT, width=1), row=1, col=1)
+    fig.add_trace(_line(t_clean, signal_clean, 'Señal Original', COLOR_CLEAN, width=2, dash='dash', opacity=0.7), row=1, col=1)
+
+    # Señal filtrada
+    fig.add_trace(_line(t_filtered, signal_filtered, 'Señal Filtrada', COLOR_FILTERED), row=2, col=1)
+    fig.add_trace(_line(t_clean, signal_clean, 'Señal Original', COLOR_CLEAN, width=2, dash='dash', opacity=0.7, showlegend=False), row=2, col=1)
+
+    # Comparación
+    fig.add_trace(_line(t_input, signal_input, 'Señal + Ruido', COLOR_INPUT, width=1, opacity=0.6, showlegend=False), row=3, col=1)
+    fig.add_trace(_line(t_filtered, signal_filtered, 'Señal Filtrada', COLOR_FILTERED, showlegend=False), row=3, col=1)
+
+    for row in (1, 2, 3):
+        fig.update_yaxes(title_text='Amplitud', row=row, col=1)
+    fig.update_xaxes(title_text='Tiempo (s)', row=3, col=1)
+    fig.update_layout(height=650, margin=dict(l=10, r=10, t=40, b=10))
+    return fig
+
+
+def plot_spectra(freqs, spectrum_input, spectrum_filtered, markers):
+    fig = make_subplots(
+        rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.08,
+        subplot_titles=('Espectro de Frecuencias - Entrada', 'Espectro de Frecuencias - Filtrada', 'Comparación Espectral'),
+    )
+
+    # Espectro de entrada y filtrado
+    fig.add_trace(_line(freqs, spectrum_input, 'Entrada', COLOR_INPUT), row=1, col=1)
+    fig.add_trace(_line(freqs, spectrum_filtered, 'Filtrada', COLOR_FILTERED), row=2, col=1)
+
+    # Comparación de espectros
+    fig.add_trace(_line(freqs, spectrum_input, 'Entrada', COLOR_INPUT, width=1, opacity=0.6, showlegend=False), row=3, col=1)
+    fig.add_trace(_line(freqs, spectrum_filtered, 'Filtrada', COLOR_FILTERED, showlegend=False), row=3, col=1)
+    _add_markers(fig, markers, row=3, col=1)
+
+    for row in (1, 2, 3):
+        fig.update_yaxes(title_text='Magnitud', row=row, col=1)
+    fig.update_xaxes(range=[0, DISPLAY_MAX_FREQ])
+    fig.update_xaxes(title_text='Frecuencia (Hz)', row=3, col=1)
+    fig.update_layout(height=650, margin=dict(l=10, r=10, t=40, b=10))
+    return fig
+
+
+def plot_bode(bode, markers):
+    fig = make_subplots(
+        rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.08,
+        subplot_titles=('Magnitud', 'Fase', 'Retardo de Grupo'),
+    )
+    fig.add_trace(_line(bode.freqs, bode.magnitude_db, 'Magnitud (dB)', COLOR_INPUT), row=1, col=1)
+    fig.add_trace(_line(bode.freqs, bode.phase_deg, 'Fase (°)', COLOR_FILTERED), row=2, col=1)
+    fig.add_trace(_line(bode.freqs, bode.group_delay * 1000, 'Retardo (ms)', COLOR_CLEAN), row=3, col=1)
+
+    # Dibujar línea(s) de corte según tipo de filtro
+    for row in (1, 2, 3):
+        _add_markers(fig, markers if row == 1 else [(freq, "") for freq, _ in markers], row=row, col=1)
+
+    # Por debajo de -80 dB solo se ve el piso numérico
+    fig.update_yaxes(title_text='dB', range=[max(-80, float(bode.magnitude_db.min())) - 3, 3], row=1, col=1)
+    fig.update_yaxes(title_text='Grados', row=2, col=1)
+    fig.update_yaxes(title_text='ms', row=3, col=1)
+    fig.update_xaxes(type='log')
+    fig.update_xaxes(title_text='Frecuencia (Hz)', row=3, col=1)
+    fig.update_layout(height=650, showlegend=False, margin=dict(l=10, r=10, t=40, b=10))
+    return fig
+
+
+def plot_tolerance_band(freqs, gains, markers, nominal=None):
+    # gains: percentiles (P5, P50, P95) de la ganancia en dB sobre los sorteos;
+    # nominal: ganancia en dB con los valores nominales, si se quiere superponer
+    low, mid, high = gains
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=freqs, y=high, mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'))
+    fig.add_trace(go.Scatter(
+        x=freqs, y=low, mode='lines', line=dict(width=0), fill='tonexty',
+        fillcolor='rgba(0, 0, 255, 0.2)', name='P5–P95',
+    ))
+    fig.add_trace(_line(freqs, mid, 'Mediana', COLOR_INPUT))
+    if nominal is not None:
+        fig.add_trace(_line(freqs, nominal, 'Nominal', COLOR_FILTERED, dash='dash'))
+    _add_markers(fig, markers)
+    fig.update_layout(
+        title="Dispersión de la ganancia por tolerancias",
+        xaxis=dict(title="Frecuencia (Hz)", type='log'),
+        yaxis=dict(title="Ganancia (dB)", range=[max(-60, float(low.min())) - 3, 3]),
+        height=400,
+        margin=dict(l=10, r=10, t=40, b=10),
+    )
+    return fig
+
+
+def plot_psd(freqs, psd_input, psd_filtered, markers):
+    # PSD de Welch en dB (V²/Hz) de la entrada y la salida superpuestas
+    fig = go.Figure()
+    with np.errstate(divide='ignore'):
+        fig.add_trace(_line(freqs, 10 * np.log10(psd_input), 'Entrada', COLOR_INPUT, width=1, opacity=0.6))
+        fig.add_trace(_line(freqs, 10 * np.log10(psd_filtered), 'Filtrada', COLOR_FILTERED))
+    _add_markers(fig, markers)
+    fig.update_layout(
+        xaxis=dict(title="Frecuencia (Hz)", range=[0, DISPLAY_MAX_FREQ]),
+        yaxis=dict(title="PSD (dB/Hz)"),
+        height=350,
+        margin=dict(l=10, r=10, t=10, b=10),
+    )
+    return fig
+
+
+def plot_spectrogram(times, freqs, power, height=350, uirevision=None):
+    # power: (segmentos, bins) en V²/Hz; se dibuja en dB con piso a -120 dB
+    power_db = 10 * np.log10(np.maximum(power, 1e-12)).astype(np.float32)
+    fig = go.Figure(go.Heatmap(
+        x=times, y=freqs, z=power_db.T, colorscale='Viridis',
+        colorbar=dict(title='dB/Hz'), hovertemplate='%{x:.2f} s<br>%{y:.1f} Hz<br>%{z:.1f} dB<extra></extra>',
+    ))
+    fig.update_layout(
+        xaxis_title="Tiempo (s)", yaxis_title="Frecuencia (Hz)",
+        height=height, margin=dict(l=10, r=10, t=10, b=10), uirevision=uirevision,
+    )
+    return fig
@@ -0,0 +1,73 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from engine import (
+    IncrementalSpectrogram,
+    RealtimeSimulation,
+    minmax_decimate,
+    nperseg_for,
+    sample_count,
+    segment_count,
+    segment_plan,
+)
+
+from .plots import COLOR_CLEAN, COLOR_FILTERED, COLOR_INPUT, plot_spectrogram
+
+# Resolución del espectrograma en vivo: segmentos cortos para seguir los cambios
+REALTIME_SPECTRAL_RESOLUTION = 5.0
+
+
+def _realtime_frame(running):
+    # Cada ejecución del fragmento avanza un bloque de fs/fps muestras
+    sim = st.session_state.realtime_sim
+    if running:
+        sim.step()
+    window = sim.window()
+
+    fig = go.Figure()
+    for name, label, color, dash in (
+        ("signal_input", "Entrada", COLOR_INPUT, None),
+        ("signal_clean", "Señal Original", COLOR_CLEAN, "dash"),
+        ("signal_filtered", "Filtrada (causal)", COLOR_FILTERED, None),
+    ):
+        t, y = minmax_decimate(window["t"], window[name])
+        fig.add_trace(go.Scatter(x=t, y=y, mode='lines', name=label, line=dict(color=color, width=1.5, dash=dash)))
+    fig.update_layout(
+        xaxis_title="Tiempo (s)", yaxis_title="Amplitud",
+        height=350, margin=dict(l=10, r=10, t=10, b=10), uirevision="realtime",
+    )
+    st.plotly_chart(fig, use_container_width=True, key="realtime_chart")
+    st.caption(f"Tiempo simulado: {sim.elapsed:.2f} s")
+
+    # Solo se transformaron los segmentos completados por el bloque nuevo
+    spectrogram = sim.spectrograms["signal_filtered"]
+    times, frames = spectrogram.window()
+    if len(times):
+        st.plotly_chart(
+            plot_spectrogram(times, spectrogram.plan.freqs, frames, height=250, uirevision="realtime"),
+            use_container_width=True, key="realtime_spectrogram",
+        )
+
+
+def render_realtime(params):
+    with st.expander("📡 Tiempo real"):
+        st.caption("Filtrado causal con sosfilt: muestra el desfase y los transitorios que filtfilt oculta")
+        col1, col2, col3 = st.columns(3)
+        running = col1.toggle("Ejecutar", key="realtime_running")
+        fps = col2.slider("Cuadros por segundo", 1, 30, 10, key="realtime_fps")
+        window = col3.slider("Ventana visible (s)", 0.5, 10.0, 2.0, 0.5, key="realtime_window")
+
+        # Un cambio de parámetros reinicia la simulación (y el estado del filtro)
+        key = (params, fps, window)
+        if st.session_state.get("realtime_key") != key:
+            st.session_state.realtime_key = key
+            nperseg = nperseg_for(params.fs, REALTIME_SPECTRAL_RESOLUTION)
+            plan = segment_plan(nperseg, nperseg // 2, params.fs)
+            max_frames = max(1, segment_count(sample_count(params.fs, window), plan))
+            block_size = max(1, round(params.fs / fps))
+            st.session_state.realtime_sim = RealtimeSimulation(
+                params, block_size=block_size, window=window,
+                spectrograms={"signal_filtered": IncrementalSpectrogram(plan, max_frames, block_size)},
+            )
+
+        st.fragment(run_every=1 / fps if running else None)(_realtime_frame)(running)
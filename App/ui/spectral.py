@@ -0,0 +1,76 @@
+import streamlit as st
+
+from engine import SPECTRAL_WINDOWS, nperseg_for, segment_plan, spectrogram, welch_psd
+
+from .plots import cutoff_markers, plot_psd, plot_spectrogram
+
+RESOLUTIONS = [0.5, 1.0, 2.0, 5.0]
+OVERLAPS = [0, 25, 50, 75]
+WINDOW_LABELS = {"hann": "Hann", "hamming": "Hamming", "blackman": "Blackman"}
+
+# Columnas que se envían al navegador; por encima se promedian de a grupos
+MAX_SPECTROGRAM_FRAMES = 400
+
+
+def _reduce_frames(times, power, limit=MAX_SPECTROGRAM_FRAMES):
+    # Promedia grupos de columnas consecutivas (la potencia se puede promediar)
+    group = -(-len(times) // limit)
+    if group == 1:
+        return times, power
+    count = len(times) // group * group
+    return (times[:count].reshape(-1, group).mean(axis=1),
+            power[:count].reshape(-1, group, power.shape[1]).mean(axis=1))
+
+
+def _render_incremental(params, spectrograms):
+    # Por bloques se muestran los espectrogramas que acumuló la corrida: no
+    # se vuelve a recorrer la señal (los controles de segmentación no aplican)
+    plan = spectrograms["signal_input"].plan
+    st.caption(f"Por bloques: {plan.nperseg} muestras por segmento · resolución "
+               f"{plan.fs / plan.nperseg:.2f} Hz · {spectrograms['signal_input'].segments} segmentos")
+    st.plotly_chart(
+        plot_psd(plan.freqs, spectrograms["signal_input"].psd().copy(),
+                 spectrograms["signal_filtered"].psd().copy(), cutoff_markers(params)),
+        use_container_width=True,
+    )
+    source = st.radio("Espectrograma", ["Entrada", "Filtrada"], index=1, horizontal=True, key="spectral_source")
+    times, power = spectrograms["signal_input" if source == "Entrada" else "signal_filtered"].window()
+    if len(times) == 0:
+        st.info("La señal es más corta que un segmento.")
+        return
+    times, power = _reduce_frames(times.copy(), power.copy())
+    st.plotly_chart(plot_spectrogram(times, plan.freqs, power), use_container_width=True)
+
+
+def render_spectral(params, values):
+    # Welch y STFT sobre la salida del grafo (a la tasa de análisis si es multitasa)
+    with st.expander("🌈 PSD (Welch) y espectrograma"):
+        spectrograms = values.get("spectrograms")
+        if spectrograms is not None:
+            if st.toggle("Mostrar", key="spectral_enabled"):
+                _render_incremental(params, spectrograms)
+            return
+        col1, col2, col3 = st.columns(3)
+        resolution = col1.select_slider("Resolución (Hz)", RESOLUTIONS, value=1.0, key="spectral_resolution")
+        overlap = col2.select_slider("Solapamiento (%)", OVERLAPS, value=50, key="spectral_overlap")
+        window = col3.selectbox("Ventana", SPECTRAL_WINDOWS, format_func=WINDOW_LABELS.get, key="spectral_window")
+        if not st.toggle("Calcular", key="spectral_enabled"):
+            return
+
+        _, _, _, signal_input, signal_filtered, fs = values["output"]
+        nperseg = nperseg_for(fs, resolution, len(signal_input))
+        # Plan memoizado por (nperseg, solapamiento, fs, ventana)
+        plan = segment_plan(nperseg, nperseg * overlap // 100, fs, window)
+        st.caption(f"{nperseg} muestras por segmento · resolución {fs / nperseg:.2f} Hz")
+
+        st.plotly_chart(
+            plot_psd(plan.freqs, welch_psd(signal_input, plan), welch_psd(signal_filtered, plan), cutoff_markers(params)),
+            use_container_width=True,
+        )
+        source = st.radio("Espectrograma", ["Entrada", "Filtrada"], index=1, horizontal=True, key="spectral_source")
+        times, power = spectrogram(signal_input if source == "Entrada" else signal_filtered, plan)
+        if len(times) == 0:
+            st.info("La señal es más corta que un segmento.")
+            return
+        times, power = _reduce_frames(times, power)
+        st.plotly_chart(plot_spectrogram(times, plan.freqs, power), use_container_width=True)
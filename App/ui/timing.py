@@ -0,0 +1,33 @@
+import streamlit as st
+
+from engine import TIMING_LOG, aggregate
+
+
+def finish_rerun(timer, page, reused=()):
+    """Guarda los tiempos del rerun en el registro y los muestra en la barra lateral."""
+    TIMING_LOG.append(timer.as_record(page=page))
+
+    with st.sidebar.expander("⏱️ Rendimiento"):
+        rows = [
+            {"Etapa": name, "Ejecutada": "✅", "Tiempo (ms)": round(seconds * 1000, 2)}
+            for name, seconds in timer.stages.items()
+        ]
+        rows += [{"Etapa": name, "Ejecutada": "♻️", "Tiempo (ms)": 0.0} for name in reused]
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+        st.write(f"Total: {timer.total * 1000:.1f} ms")
+
+        if st.checkbox("Ver p50/p95 acumulados", key=f"timing_stats_{page}"):
+            stats = aggregate(TIMING_LOG.records(), page=page)
+            st.dataframe(
+                [
+                    {
+                        "Etapa": name,
+                        "Muestras": s["count"],
+                        "p50 (ms)": round(s["p50"] * 1000, 2),
+                        "p95 (ms)": round(s["p95"] * 1000, 2),
+                    }
+                    for name, s in stats.items()
+                ],
+                hide_index=True,
+                use_container_width=True,
+            )
@@ -1,42 +1,116 @@
 import streamlit as st
 import plotly.graph_objs as go
 import numpy as np
-import time
+import pandas as pd
+
+# Animación del lado del cliente: todos los cuadros se calculan juntos y el
+# navegador los reproduce a ritmo fijo, sin reruns ni envíos por cuadro
+FRAME_MS = 50          # duración de cada cuadro (ms)
+MAX_FRAMES = 120       # cuadros por período de fase
+PLAY_MINUTES = 10      # duración de la reproducción continua
+X_POINTS = 1000
+
+
+# Inductores como arreglo estructurado: una fila por fuente
+MAGNETICO, ELECTRICO = 0, 1
+INDUCTOR_DTYPE = np.dtype([
+    ("type", "u1"),        # MAGNETICO o ELECTRICO
+    ("x", "f8"),
+    ("y", "f8"),
+    ("strength", "f8"),    # intensidad (magnético) o amplitud (eléctrico)
+    ("radius", "f8"),      # radio de influencia; el eléctrico decae como exp(-d/radio)
+    ("freq", "f8"),        # solo eléctrico
+])
+ELECTRIC_RADIUS = 1 / 3
+
+
+def make_inductors(magnetic, electric):
+    # Junta las tablas del editor en un único arreglo estructurado
+    magnetic = magnetic.dropna()
+    electric = electric.dropna()
+    inductors = np.zeros(len(magnetic) + len(electric), dtype=INDUCTOR_DTYPE)
+    m = len(magnetic)
+    inductors["type"][m:] = ELECTRICO
+    inductors["x"] = np.concatenate([magnetic["x"], electric["x"]])
+    inductors["y"] = np.concatenate([magnetic["y"], electric["y"]])
+    inductors["strength"][:m] = magnetic["intensidad"]
+    inductors["strength"][m:] = electric["amplitud"]
+    inductors["radius"][:m] = magnetic["radio"]
+    inductors["radius"][m:] = ELECTRIC_RADIUS
+    inductors["freq"][m:] = electric["frecuencia"]
+    return inductors
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def spatial_bases(inductors, amp_base, freq_base):
+    # Parte de la señal que no depende de la fase, una vez por estado de sliders.
+    # Con sin(a - φ) = sin a·cos φ - cos a·sin φ la señal total queda
+    # y(φ) = S·cos φ - C·sin φ, así que cada cuadro es una sola suma-producto
+    # sin importar cuántos inductores haya.
+    x = np.linspace(0, 10, X_POINTS)
+    a = 2 * np.pi * freq_base * x
+
+    # Distancias de todas las fuentes a toda la grilla de una vez: (N, X)
+    d = np.hypot(x - inductors["x"][:, None], inductors["y"][:, None])
+    radius = inductors["radius"][:, None]
+    magnetic = inductors["type"] == MAGNETICO
+    strength = inductors["strength"][:, None]
+
+    # Magnéticos: modulan la amplitud de la señal base
+    gain = strength[magnetic] * np.exp(-(d[magnetic] / radius[magnetic])**2)
+    envelope = amp_base * (1 + gain.sum(axis=0))
+    S = envelope * np.sin(a)
+    C = envelope * np.cos(a)
+
+    # Eléctricos: suman su propia onda, atenuada con la distancia
+    electric = ~magnetic
+    envelope2 = strength[electric] * np.exp(-d[electric] / radius[electric])
+    b = 2 * np.pi * inductors["freq"][electric][:, None] * x
+    S += np.einsum("nx,nx->x", envelope2, np.sin(b))
+    C += np.einsum("nx,nx->x", envelope2, np.cos(b))
+    return x, S, C
+
 
 st.set_page_config(layout="wide")
 st.title("🧲 Simulador de Señal con Múltiples Inductores")
 
-if st.button("🔁 Reiniciar fase"):
-    st.session_state.phase = 0.0
+# Cada rerun vuelve a armar la animación desde fase 0
+st.button("🔁 Reiniciar fase")
 
 # Columnas: izq, centro (gráfico), der
 col1, col2, col3 = st.columns([1.2, 2.5, 1.2])
 
-with col2:
-    modo = st.radio("Selecciona los inductores a activar:", ["Inductor Magnético", "Inductor Eléctrico", "Ambos"])
-    # Fase animada
-    if "phase" not in st.session_state:
-        st.session_state.phase = 0.0
-
-
-# ========================== CONTROLES INDUCTOR 1 ==========================
+# ========================== INDUCTORES MAGNÉTICOS ==========================
 with col1:
-    if modo in ["Inductor Magnético", "Ambos"]:
-        st.subheader("🔴 Inductor Magnético")
-        x1 = st.slider("Posición X", 0.0, 10.0, 3.0, 0.1, key="x1")
-        y1 = st.slider("Posición Y", -4.0, 4.0, 0.0, 0.1, key="y1")
-        intensidad1 = st.slider("Intensidad campo", 0.0, 2.0, 1.0, 0.1)
-        radio1 = st.slider("Radio de influencia", 1.0, 5.0, 2.0, 0.1)
-
-# ========================== CONTROLES INDUCTOR 2 ==========================
+    st.subheader("🔴 Inductores Magnéticos")
+    magnetic_table = st.data_editor(
+        pd.DataFrame({"x": [3.0], "y": [0.0], "intensidad": [1.0], "radio": [2.0]}),
+        num_rows="dynamic",
+        key="inductores_magneticos",
+        column_config={
+            "x": st.column_config.NumberColumn("Posición X", min_value=0.0, max_value=10.0, step=0.1, default=5.0),
+            "y": st.column_config.NumberColumn("Posición Y", min_value=-4.0, max_value=4.0, step=0.1, default=0.0),
+            "intensidad": st.column_config.NumberColumn("Intensidad campo", min_value=0.0, max_value=2.0, step=0.1, default=1.0),
+            "radio": st.column_config.NumberColumn("Radio de influencia", min_value=1.0, max_value=5.0, step=0.1, default=2.0),
+        },
+    )
+
+# ========================== INDUCTORES ELÉCTRICOS ==========================
 with col3:
-
-    if modo in ["Inductor Eléctrico", "Ambos"]:
-        st.subheader("🔵 Inductor Eléctrico")
-        x2 = st.slider("Posición X", 0.0, 10.0, 7.0, 0.1, key="x2")
-        y2 = st.slider("Posición Y", -4.0, 4.0, 0.0, 0.1, key="y2")
-        amp2 = st.slider("Amplitud señal 2", 0.0, 2.0, 1.0, 0.1)
-        freq2 = st.slider("Frecuencia señal 2", 0.0, 5.0, 1.0, 0.1)
+    st.subheader("🔵 Inductores Eléctricos")
+    electric_table = st.data_editor(
+        pd.DataFrame({"x": [7.0], "y": [0.0], "amplitud": [1.0], "frecuencia": [1.0]}),
+        num_rows="dynamic",
+        key="inductores_electricos",
+        column_config={
+            "x": st.column_config.NumberColumn("Posición X", min_value=0.0, max_value=10.0, step=0.1, default=5.0),
+            "y": st.column_config.NumberColumn("Posición Y", min_value=-4.0, max_value=4.0, step=0.1, default=0.0),
+            "amplitud": st.column_config.NumberColumn("Amplitud señal", min_value=0.0, max_value=2.0, step=0.1, default=1.0),
+            "frecuencia": st.column_config.NumberColumn("Frecuencia señal", min_value=0.0, max_value=5.0, step=0.1, default=1.0),
+        },
+    )
+
+inductors = make_inductors(magnetic_table, electric_table)
 
 # ========================== GRAFICO EN EL CENTRO Y CONTROLES GLOBALES ==========================
 with col2:
@@ -46,43 +120,53 @@ with col2:
     freq_base = st.slider("Frecuencia", 0.5, 5.0, 1.0)
     speed = st.slider("Velocidad", 0.01, 0.2, 0.05)
 
-    x = np.linspace(0, 10, 1000)
     plot_area = st.empty()
 
-    for _ in range(10):
-        phase = st.session_state.phase
-        y = amp_base * np.sin(2 * np.pi * freq_base * x - phase)
-
-        if modo in ["Inductor Magnético", "Ambos"]:
-            d1 = np.sqrt((x - x1)**2 + (0 - y1)**2)
-            influence1 = intensidad1 * np.exp(-(d1 / radio1)**2)
-            y *= (1 + influence1)
-
-        if modo in ["Inductor Eléctrico", "Ambos"]:
-            d2 = np.sqrt((x - x2)**2 + (0 - y2)**2)
-            influence2 = amp2 * np.exp(-d2 * 3) * np.sin(2 * np.pi * freq2 * x - phase)
-            y += influence2
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', line=dict(color='cyan', width=3), name='Señal total'))
-        fig.add_trace(go.Scatter(x=[0, 10], y=[0, 0], mode='lines', line=dict(color='gray', width=1), name='Cable'))
-
-        if modo in ["Inductor Magnético", "Ambos"]:
-            fig.add_trace(go.Scatter(x=[x1], y=[y1], mode='markers',
-                                     marker=dict(size=14, color='red'), name='Inductor 1'))
-
-        if modo in ["Inductor Eléctrico", "Ambos"]:
-            fig.add_trace(go.Scatter(x=[x2], y=[y2], mode='markers',
-                                     marker=dict(size=14, color='blue'), name='Inductor 2'))
-
-        fig.update_layout(
-            xaxis=dict(range=[0, 10]),
-            yaxis=dict(range=[-5, 5]),
-            showlegend=True,
-            height=450,
-            margin=dict(l=10, r=10, t=10, b=10)
-        )
-
-        plot_area.plotly_chart(fig, use_container_width=True)
-        st.session_state.phase += speed
-        time.sleep(0.05)
+    x, S, C = spatial_bases(inductors, amp_base, freq_base)
+
+    # Un período completo de fase (2π) en cuadros; si hacen falta más que
+    # MAX_FRAMES se alarga cada cuadro para conservar la velocidad angular
+    n_frames = int(min(MAX_FRAMES, max(1, round(2 * np.pi / speed))))
+    phase_step = 2 * np.pi / n_frames
+    frame_ms = FRAME_MS * phase_step / speed
+    phase = np.arange(n_frames) * phase_step
+
+    # Todas las fases a la vez: arreglo 2-D (cuadro, x)
+    y = np.cos(phase)[:, None] * S - np.sin(phase)[:, None] * C
+    y = y.astype(np.float32)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x, y=y[0], mode='lines', line=dict(color='cyan', width=3), name='Señal total'))
+    fig.add_trace(go.Scatter(x=[0, 10], y=[0, 0], mode='lines', line=dict(color='gray', width=1), name='Cable'))
+
+    # Un solo trazo de marcadores por tipo, con todas sus posiciones
+    for kind, color, name in [(MAGNETICO, 'red', 'Magnéticos'), (ELECTRICO, 'blue', 'Eléctricos')]:
+        sources = inductors[inductors["type"] == kind]
+        if len(sources):
+            fig.add_trace(go.Scatter(x=sources["x"], y=sources["y"], mode='markers',
+                                     marker=dict(size=14, color=color), name=name))
+
+    # Cada cuadro solo reemplaza la "y" de la señal total (traza 0)
+    fig.frames = [go.Frame(data=[go.Scatter(y=frame)], traces=[0], name=str(i)) for i, frame in enumerate(y)]
+
+    # La animación de Plotly no se repite sola: se encadena el mismo período
+    # muchas veces por nombre, sin duplicar los datos
+    repeats = max(1, int(PLAY_MINUTES * 60_000 / (frame_ms * n_frames)))
+    play_args = dict(frame=dict(duration=frame_ms, redraw=False), transition=dict(duration=0), mode="immediate")
+
+    fig.update_layout(
+        xaxis=dict(range=[0, 10]),
+        yaxis=dict(range=[-5, 5]),
+        showlegend=True,
+        height=450,
+        margin=dict(l=10, r=10, t=10, b=10),
+        updatemenus=[dict(
+            type="buttons", direction="left", x=0, y=1.1, xanchor="left", showactive=False,
+            buttons=[
+                dict(label="▶️", method="animate", args=[[f.name for f in fig.frames] * repeats, play_args]),
+                dict(label="⏸️", method="animate", args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")]),
+            ],
+        )],
+    )
+
+    plot_area.plotly_chart(fig, use_container_width=True)